@@ -0,0 +1,66 @@
+import argparse
+import gc
+import random
+import tracemalloc
+import typing
+
+from glinski import *
+from glinski._dataholders.moveCharacters import MoveCharacter
+
+__all__ = ['main']
+
+def _measure(factory:typing.Callable[[], typing.Any], count:int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    keep = [factory() for i in range(count)]
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del keep
+    return size / count
+
+def _positions(count:int, seed:int) -> typing.List[Position]:
+    rng = random.Random(seed)
+    ans = list()
+    position = Position.native()
+    while len(ans) < count:
+        moves = sorted(position.legal_moves(), key=str)
+        if not moves:
+            position = Position.native()
+            continue
+        position = position.apply(rng.choice(moves))
+        ans.append(position)
+    return ans
+
+def main(args:typing.Optional[typing.List[str]]=None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Report the memory held per dataholder instance.",
+    )
+    parser.add_argument('--count', type=int, default=10000)
+    parser.add_argument('--seed', type=int, default=0)
+    ns = parser.parse_args(args)
+    position = _positions(100, ns.seed)[-1]
+    move = sorted(position.legal_moves(), key=str)[0]
+    rows = [
+        ('Piece', lambda: Piece(
+            kind=PieceKind.QUEEN,
+            player=Player.WHITE,
+        )),
+        ('Move', lambda: Move(
+            from_cell=Cell.e4,
+            to_cell=Cell.e5,
+            promotion=None,
+        )),
+        ('MoveCharacter', lambda: MoveCharacter()),
+        ('Termination', lambda: Termination(
+            kind=TerminationKind.CHECKMATE,
+            subject=Player.WHITE,
+        )),
+        ('Position', lambda: position.apply(move)),
+        ('suspects', lambda: Move.from_uci('e4e5').suspects()),
+    ]
+    for name, factory in rows:
+        size = _measure(factory, ns.count)
+        print(f"{name}: {size:.1f} bytes")
+
+if __name__ == '__main__':
+    main()
@@ -1,3 +1,8 @@
 from ._dataholders import *
 from ._enums import *
 from ._errors import *
+from ._book import *
+from ._perft import *
+from ._records import *
+from ._engine import *
+from ._tablebase import *
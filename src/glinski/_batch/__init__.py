@@ -0,0 +1,238 @@
+import typing
+
+import numpy as np
+
+from glinski._consts import *
+from glinski._dataholders import *
+from glinski._dataholders.motions import *
+from glinski._enums import *
+
+__all__ = [
+    'attack_counts',
+    'decode',
+    'encode',
+    'is_check',
+    'mobility',
+]
+
+CELLS = tuple(Cell)
+INDICES = {cell:i for i, cell in enumerate(CELLS)}
+EMPTY = len(CELLS)
+CHUNK = 4096
+CODES = {None:0}
+for _player in Player:
+    for _kind in PieceKind:
+        CODES[Piece.by_items(kind=_kind, player=_player)] = (
+            _kind.value if _player == Player.WHITE else -_kind.value
+        )
+PIECES_BY_CODE = {v:k for k, v in CODES.items()}
+SIGNS = {Player.WHITE:1, Player.BLACK:-1}
+RAY = typing.Tuple[np.ndarray, typing.Tuple[np.ndarray, ...]]
+
+def _pad(rows:typing.Iterable[typing.Iterable[int]]) -> np.ndarray:
+    rows = [list(row) for row in rows]
+    width = max(1, max(len(row) for row in rows))
+    ans = np.full((len(rows), width), EMPTY, dtype=np.intp)
+    for i, row in enumerate(rows):
+        ans[i, :len(row)] = row
+    return ans
+
+def _leaps(motion:Motion) -> np.ndarray:
+    return _pad(
+        [INDICES[ray[0]] for ray in motion.rays(cell) if ray]
+        for cell in CELLS
+    )
+
+def _rays(motion:Motion) -> typing.Tuple[RAY, ...]:
+    ans = list()
+    for j in range(len(motion)):
+        rays = [motion.rays(cell)[j] for cell in CELLS]
+        order = sorted(range(len(CELLS)), key=lambda i: -len(rays[i]))
+        paths = list()
+        for k in range(len(rays[order[0]])):
+            paths.append(np.array([
+                INDICES[rays[i][k]]
+                for i in order
+                if len(rays[i]) > k
+            ], dtype=np.intp))
+        ans.append((np.array(order, dtype=np.intp), tuple(paths)))
+    return tuple(ans)
+
+def _cells(predicate:typing.Callable[[Cell], bool]) -> np.ndarray:
+    return np.array([predicate(cell) for cell in CELLS] + [False])
+
+DIAGONAL_RAYS = _rays(consts.motions.DIAGONAL)
+FILE_RAYS = _rays(consts.motions.FILE)
+KNIGHT_LEAPS = _leaps(consts.motions.HORSE)
+KING_LEAPS = np.concatenate([
+    _leaps(consts.motions.DIAGONAL),
+    _leaps(consts.motions.FILE),
+], axis=1)
+PAWN_LEAPS_BY_PLAYER = {
+    player:_leaps(consts.motions.PAWN_ATTACKS_BY_PLAYER[player])
+    for player in Player
+}
+PAWN_WALKS_BY_PLAYER = {
+    player:_leaps(consts.motions.PAWN_WALKS_BY_PLAYER[player])[:, 0]
+    for player in Player
+}
+PROMOTIONS_BY_PLAYER = {
+    player:_cells(lambda cell: cell.promotion(player))
+    for player in Player
+}
+PAWNSTARTS_BY_PLAYER = {
+    player:_cells(lambda cell: cell.native() == Piece.by_items(
+        kind=PieceKind.PAWN,
+        player=player,
+    ))
+    for player in Player
+}
+
+def _code(kind:PieceKind, player:Player) -> int:
+    return CODES[Piece.by_items(kind=kind, player=player)]
+
+def _chunks(
+    boards:np.ndarray,
+) -> typing.Generator[typing.Tuple[slice, np.ndarray], None, None]:
+    boards = np.asarray(boards)
+    if boards.ndim != 2 or boards.shape[1] != len(CELLS):
+        raise ValueError(boards.shape)
+    for start in range(0, len(boards), CHUNK):
+        chunk = boards[start:start + CHUNK]
+        padded = np.zeros((len(CELLS) + 1, len(chunk)), dtype=np.int8)
+        padded[:-1] = chunk.T
+        yield slice(start, start + len(chunk)), padded
+
+def _blockers(padded:np.ndarray, ray:RAY) -> np.ndarray:
+    order, paths = ray
+    blockers = np.zeros((len(CELLS), padded.shape[1]), dtype=np.int8)
+    for cells in paths:
+        values = padded[cells]
+        found = blockers[:len(cells)]
+        np.copyto(found, values, where=found == 0)
+    ans = np.empty_like(blockers)
+    ans[order] = blockers
+    return ans
+
+def _reach(occupied:np.ndarray, free:np.ndarray, ray:RAY) -> np.ndarray:
+    order, paths = ray
+    reach = np.zeros((len(CELLS), occupied.shape[1]), dtype=np.uint8)
+    found = np.zeros((len(CELLS), occupied.shape[1]), dtype=bool)
+    for cells in paths:
+        part = found[:len(cells)]
+        reach[:len(cells)] += free[cells] & ~part
+        part |= occupied[cells]
+    ans = np.empty_like(reach)
+    ans[order] = reach
+    return ans
+
+def _leap(padded:np.ndarray, leaps:np.ndarray, code:int) -> np.ndarray:
+    ans = np.zeros((len(CELLS), padded.shape[1]), dtype=np.uint8)
+    for j in range(leaps.shape[1]):
+        ans += padded[leaps[:, j]] == code
+    return ans
+
+def _attack_counts(padded:np.ndarray, player:Player) -> np.ndarray:
+    pawn = _code(PieceKind.PAWN, player)
+    knight = _code(PieceKind.KNIGHT, player)
+    bishop = _code(PieceKind.BISHOP, player)
+    rook = _code(PieceKind.ROOK, player)
+    queen = _code(PieceKind.QUEEN, player)
+    king = _code(PieceKind.KING, player)
+    ans = _leap(padded, PAWN_LEAPS_BY_PLAYER[player.invert()], pawn)
+    ans += _leap(padded, KNIGHT_LEAPS, knight)
+    ans += _leap(padded, KING_LEAPS, king)
+    for rays, kind in ((DIAGONAL_RAYS, bishop), (FILE_RAYS, rook)):
+        if not ((padded == kind) | (padded == queen)).any():
+            continue
+        for ray in rays:
+            blockers = _blockers(padded, ray)
+            ans += (blockers == kind) | (blockers == queen)
+    return ans
+
+def _mobility(padded:np.ndarray, player:Player) -> np.ndarray:
+    sign = SIGNS[player]
+    board = padded[:-1]
+    enemy = padded * sign < 0
+    empty = padded == 0
+    empty[-1] = False
+    free = padded * sign <= 0
+    free[-1] = False
+    pawn = _code(PieceKind.PAWN, player)
+    knight = _code(PieceKind.KNIGHT, player)
+    bishop = _code(PieceKind.BISHOP, player)
+    rook = _code(PieceKind.ROOK, player)
+    queen = _code(PieceKind.QUEEN, player)
+    king = _code(PieceKind.KING, player)
+    ans = np.zeros((len(CELLS), padded.shape[1]), dtype=np.uint8)
+    for leaps, code in ((KNIGHT_LEAPS, knight), (KING_LEAPS, king)):
+        pieces = board == code
+        for j in range(leaps.shape[1]):
+            ans += free[leaps[:, j]] & pieces
+    occupied = padded != 0
+    for rays, kind in ((DIAGONAL_RAYS, bishop), (FILE_RAYS, rook)):
+        pieces = (board == kind) | (board == queen)
+        if not pieces.any():
+            continue
+        for ray in rays:
+            ans += _reach(occupied, free, ray) * pieces
+    pawns = board == pawn
+    weights = np.where(PROMOTIONS_BY_PLAYER[player], 4, 1).astype(np.uint8)
+    leaps = PAWN_LEAPS_BY_PLAYER[player]
+    for j in range(leaps.shape[1]):
+        column = leaps[:, j]
+        ans += enemy[column] * pawns * weights[column][:, None]
+    walks = PAWN_WALKS_BY_PLAYER[player]
+    single = empty[walks] & pawns
+    ans += single * weights[walks][:, None]
+    double = single & empty[walks[np.minimum(walks, EMPTY - 1)]]
+    double &= PAWNSTARTS_BY_PLAYER[player][:-1][:, None]
+    ans += double
+    return ans.sum(axis=0, dtype=np.int32)
+
+def attack_counts(boards:np.ndarray, player:Player) -> np.ndarray:
+    if type(player) is not Player:
+        raise TypeError(player)
+    ans = np.zeros((len(boards), len(CELLS)), dtype=np.uint8)
+    for part, padded in _chunks(boards):
+        ans[part] = _attack_counts(padded, player).T
+    return ans
+
+def decode(boards:np.ndarray) -> typing.List[Arrangement]:
+    ans = list()
+    for row in np.asarray(boards).tolist():
+        try:
+            data = tuple(PIECES_BY_CODE[v] for v in row)
+        except KeyError:
+            raise ValueError(row) from None
+        if len(data) != len(CELLS):
+            raise ValueError(row)
+        ans.append(Arrangement._from_data(data))
+    return ans
+
+def encode(arrangements:typing.Iterable[Arrangement]) -> np.ndarray:
+    rows = list()
+    for arrangement in arrangements:
+        if type(arrangement) is not Arrangement:
+            raise TypeError(arrangement)
+        rows.append([CODES[p] for p in arrangement.values()])
+    ans = np.array(rows, dtype=np.int8)
+    return ans.reshape(len(rows), len(CELLS))
+
+def is_check(boards:np.ndarray, turn:Player) -> np.ndarray:
+    if type(turn) is not Player:
+        raise TypeError(turn)
+    king = _code(PieceKind.KING, turn)
+    ans = np.zeros(len(boards), dtype=bool)
+    for part, padded in _chunks(boards):
+        attacked = _attack_counts(padded, turn.invert()) > 0
+        ans[part] = (attacked & (padded[:-1] == king)).any(axis=0)
+    return ans
+
+def mobility(boards:np.ndarray, turn:Player) -> np.ndarray:
+    if type(turn) is not Player:
+        raise TypeError(turn)
+    ans = np.zeros(len(boards), dtype=np.int32)
+    for part, padded in _chunks(boards):
+        ans[part] = _mobility(padded, turn)
+    return ans
@@ -0,0 +1,177 @@
+import heapq
+import os
+import tempfile
+import typing
+
+from glinski._dataholders import *
+from glinski._dataholders.openingBooks import (
+    HEADER,
+    MAGIC,
+    MAX_COUNT,
+    MAX_WEIGHT,
+    RECORD,
+)
+from glinski._enums import *
+
+__all__ = ['build_opening_book']
+
+BUFFER = 1 << 20
+BLOCK = 4096
+MODE = 0o666
+WINS = 1
+DRAWS = 2
+LOSSES = 3
+RECORDS = typing.Iterator[typing.Tuple[int, int, int, int, int, int]]
+
+def _check(
+    plies:typing.Optional[int],
+    buffer:int,
+) -> None:
+    if plies is not None:
+        if type(plies) is not int:
+            raise TypeError(plies)
+        if plies < 0:
+            raise ValueError(plies)
+    if type(buffer) is not int:
+        raise TypeError(buffer)
+    if buffer < 1:
+        raise ValueError(buffer)
+
+def _umask() -> int:
+    ans = os.umask(0)
+    os.umask(ans)
+    return ans
+
+def _column(score:float) -> int:
+    if score > .5:
+        return WINS
+    if score < .5:
+        return LOSSES
+    return DRAWS
+
+def _columns(
+    outcome:typing.Optional[Outcome],
+) -> typing.Optional[typing.Tuple[int, int]]:
+    if outcome is None:
+        return None
+    white = outcome.for_white()
+    return _column(white), _column(1 - white)
+
+def _count(
+    counts:typing.Dict[int, typing.List[int]],
+    game:typing.Union[Game, GameRecord],
+    plies:typing.Optional[int],
+) -> None:
+    if type(game) is Game:
+        root = game.root()
+        codes = game.move_codes()
+        keys = game.keys()
+        outcome = game.result()
+    elif type(game) is GameRecord:
+        root = game.root
+        codes = game.moves
+        keys = game.keys()
+        outcome = game.result
+    else:
+        raise TypeError(game)
+    columns = _columns(outcome)
+    if root.turn == Player.WHITE:
+        parity = 0
+    else:
+        parity = 1
+    length = len(codes)
+    if plies is not None:
+        length = min(length, plies)
+    for i, key in zip(range(length), keys):
+        item = key << 16 | codes[i]
+        entry = counts.get(item)
+        if entry is None:
+            entry = [0, 0, 0, 0]
+            counts[item] = entry
+        entry[0] += 1
+        if columns is not None:
+            entry[columns[(i + parity) % 2]] += 1
+
+def _flush(
+    counts:typing.Dict[int, typing.List[int]],
+    directory:str,
+) -> str:
+    handle, path = tempfile.mkstemp(suffix='.run', dir=directory)
+    with os.fdopen(handle, 'wb') as file:
+        for item in sorted(counts):
+            weight, wins, draws, losses = counts[item]
+            file.write(RECORD.pack(
+                item >> 16,
+                item & 0xFFFF,
+                min(weight, MAX_WEIGHT),
+                min(wins, MAX_COUNT),
+                min(draws, MAX_COUNT),
+                min(losses, MAX_COUNT),
+            ))
+    counts.clear()
+    return path
+
+def _merge(runs:typing.List[RECORDS]) -> RECORDS:
+    current = None
+    for record in heapq.merge(*runs):
+        if current is not None and current[:2] == record[:2]:
+            current = (
+                current[0],
+                current[1],
+                min(current[2] + record[2], MAX_WEIGHT),
+                min(current[3] + record[3], MAX_COUNT),
+                min(current[4] + record[4], MAX_COUNT),
+                min(current[5] + record[5], MAX_COUNT),
+            )
+            continue
+        if current is not None:
+            yield current
+        current = record
+    if current is not None:
+        yield current
+
+def _read(path:str) -> RECORDS:
+    with open(path, 'rb') as file:
+        while True:
+            block = file.read(BLOCK * RECORD.size)
+            if not block:
+                return
+            yield from RECORD.iter_unpack(block)
+
+def build_opening_book(
+    games:typing.Iterable[typing.Union[Game, GameRecord]],
+    path:typing.Union[str, os.PathLike], *,
+    plies:typing.Optional[int]=None,
+    buffer:int=BUFFER,
+) -> int:
+    _check(plies, buffer)
+    path = os.fspath(path)
+    directory = os.path.dirname(os.path.abspath(path))
+    runs = list()
+    counts = dict()
+    count = 0
+    temporary = None
+    try:
+        for game in games:
+            _count(counts, game, plies)
+            if len(counts) >= buffer:
+                runs.append(_flush(counts, directory))
+        if counts or not runs:
+            runs.append(_flush(counts, directory))
+        handle, temporary = tempfile.mkstemp(suffix='.tmp', dir=directory)
+        with os.fdopen(handle, 'wb') as file:
+            file.write(HEADER.pack(MAGIC, 0))
+            for record in _merge([_read(run) for run in runs]):
+                file.write(RECORD.pack(*record))
+                count += 1
+            file.seek(0)
+            file.write(HEADER.pack(MAGIC, count))
+        os.chmod(temporary, MODE & ~_umask())
+        os.replace(temporary, path)
+        temporary = None
+    finally:
+        for run in runs:
+            os.remove(run)
+        if temporary is not None:
+            os.remove(temporary)
+    return count
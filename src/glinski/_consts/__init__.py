@@ -1,3 +1,4 @@
+import random
 import typing
 
 from isometric import Vector
@@ -6,6 +7,7 @@ from glinski._dataholders.attackerFinders import *
 from glinski._dataholders.attackFinders import *
 from glinski._dataholders.motions import *
 from glinski._dataholders.pieces import *
+from glinski._enums.cells import *
 from glinski._enums.pieces import *
 from glinski._enums.players import *
 
@@ -110,12 +112,95 @@ class attackerFinders:
     )
     PAWN_ATTACKS_BY_PLAYER = dict()
 consts.attackerFinders = attackerFinders
-for player, motion in consts.motions.PAWN_ATTACKS_BY_PLAYER.items():
+for player in Player:
     consts.attackerFinders.PAWN_ATTACKS_BY_PLAYER[player] = AttackerFinder(
-        motion=motion,
+        motion=consts.motions.PAWN_ATTACKS_BY_PLAYER[player.invert()],
         unscaled={PieceKind.PAWN},
     )
 
 
-
-
+class zobrist(_staticclass):
+    pass
+consts.zobrist = zobrist
+_random = random.Random(0)
+consts.zobrist.PIECES = {None:(0,) * len(Cell)}
+for player in Player:
+    for kind in PieceKind:
+        _piece = Piece.by_items(kind=kind, player=player)
+        consts.zobrist.PIECES[_piece] = tuple(
+            _random.getrandbits(64) for cell in Cell
+        )
+consts.zobrist.EP_COLUMNS = {None:0}
+for column in Column:
+    consts.zobrist.EP_COLUMNS[column] = _random.getrandbits(64)
+consts.zobrist.TURNS = {
+    Player.WHITE:0,
+    Player.BLACK:_random.getrandbits(64),
+}
+
+
+class values(_staticclass):
+    pass
+consts.values = values
+consts.values.PIECES = {
+    PieceKind.PAWN:100,
+    PieceKind.KNIGHT:300,
+    PieceKind.BISHOP:300,
+    PieceKind.ROOK:500,
+    PieceKind.QUEEN:900,
+    PieceKind.KING:0,
+}
+consts.values.MATE = 100000
+consts.values.STALEMATE = consts.values.MATE // 2
+consts.values.CENTER_DISTANCES = dict.fromkeys(Cell)
+consts.values.CENTER_DISTANCES[Cell.f6] = 0
+_frontier = [Cell.f6]
+while _frontier:
+    _cell = _frontier.pop(0)
+    for _ray in consts.motions.FILE.rays(_cell):
+        if _ray and consts.values.CENTER_DISTANCES[_ray[0]] is None:
+            _distance = consts.values.CENTER_DISTANCES[_cell] + 1
+            consts.values.CENTER_DISTANCES[_ray[0]] = _distance
+            _frontier.append(_ray[0])
+consts.values.SQUARES = {
+    PieceKind.PAWN:tuple(
+        8 * (cell.row() - 1) + 4 * (2 - consts.values.CENTER_DISTANCES[cell])
+        for cell in Cell
+    ),
+    PieceKind.KNIGHT:tuple(
+        10 * (3 - consts.values.CENTER_DISTANCES[cell])
+        for cell in Cell
+    ),
+    PieceKind.BISHOP:tuple(
+        5 * (3 - consts.values.CENTER_DISTANCES[cell])
+        for cell in Cell
+    ),
+    PieceKind.ROOK:tuple(
+        2 * (3 - consts.values.CENTER_DISTANCES[cell])
+        for cell in Cell
+    ),
+    PieceKind.QUEEN:tuple(
+        3 * (3 - consts.values.CENTER_DISTANCES[cell])
+        for cell in Cell
+    ),
+    PieceKind.KING:tuple(
+        5 * consts.values.CENTER_DISTANCES[cell] - 10 * (cell.row() - 1)
+        for cell in Cell
+    ),
+}
+consts.values.SCORES = {None:(0,) * len(Cell)}
+for player in Player:
+    for kind in PieceKind:
+        _piece = Piece.by_items(kind=kind, player=player)
+        _value = consts.values.PIECES[kind]
+        _squares = consts.values.SQUARES[kind]
+        if player == Player.WHITE:
+            consts.values.SCORES[_piece] = tuple(
+                _value + _squares[cell.index()]
+                for cell in Cell
+            )
+        else:
+            consts.values.SCORES[_piece] = tuple(
+                -_value - _squares[cell.vflip().index()]
+                for cell in Cell
+            )
@@ -1,6 +1,15 @@
 from .arrangements import *
+from .bitboardArrangements import *
+from .boards import *
+from .gameNodes import *
+from .gameTrees import *
+from .gameRecords import *
 from .games import *
 from .moves import *
+from .openingBooks import *
 from .pieces import *
 from .positions import *
+from .sequenceViews import *
+from .tablebases import *
 from .terminations import *
+from .transpositionTables import *
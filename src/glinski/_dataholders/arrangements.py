@@ -1,5 +1,5 @@
 import typing
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from glinski._consts import *
 from glinski._enums import *
@@ -12,24 +12,84 @@ __all__ = ['Arrangement']
 
 # global constants
 CELLS = tuple(Cell)
+INDICES = {cell:i for i, cell in enumerate(CELLS)}
 OPTIONAL_PIECES = typing.Optional[Piece]
+ZOBRIST = consts.zobrist.PIECES
+SCORES = consts.values.SCORES
+HEIGHTS = tuple(column.height() for column in Column)
+SYMBOLS = {
+    piece:piece.symbol()
+    for piece in (
+        Piece.by_items(kind=kind, player=player)
+        for player in Player
+        for kind in PieceKind
+    )
+}
+PIECES_BY_SYMBOL = {v:k for k, v in SYMBOLS.items()}
 
 # Arrangement
 @dataclass(frozen=True)
 class BaseArrangement:
     # fields
     _data:typing.Tuple[Piece]
+    _zobrist:int = field(compare=False, repr=False)
+    _score:int = field(compare=False, repr=False)
 
     # methods
     #   dunder
+    def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+        if type(other) is not type(self):
+            return NotImplemented
+        if self._zobrist != other._zobrist:
+            return False
+        return self._data == other._data
+
     def __getitem__(self, key:Cell) -> OPTIONAL_PIECES:
         if type(key) is not Cell:
             raise TypeError(key)
-        i = CELLS.index(key)
+        i = INDICES[key]
         ans = self._data[i]
         return ans
+
+    def __hash__(self) -> int:
+        return self._zobrist
     
     #   protected
+    @classmethod
+    def _from_data(cls, 
+        data:typing.Tuple[OPTIONAL_PIECES, ...],
+        zobrist:typing.Optional[int]=None,
+        score:typing.Optional[int]=None,
+    ) -> typing.Self:
+        if zobrist is None:
+            zobrist = cls._hash_data(data)
+        if score is None:
+            score = cls._score_data(data)
+        ans = object.__new__(cls)
+        BaseArrangement.__init__(
+            ans,
+            _data=data,
+            _zobrist=zobrist,
+            _score=score,
+        )
+        return ans
+
+    @classmethod
+    def _hash_data(cls, data:typing.Tuple[OPTIONAL_PIECES, ...]) -> int:
+        ans = 0
+        for i, piece in enumerate(data):
+            ans ^= ZOBRIST[piece][i]
+        return ans
+
+    @classmethod
+    def _score_data(cls, data:typing.Tuple[OPTIONAL_PIECES, ...]) -> int:
+        ans = 0
+        for i, piece in enumerate(data):
+            ans += SCORES[piece][i]
+        return ans
+
     @classmethod
     def _text(cls, 
         piece:OPTIONAL_PIECES, /, *, 
@@ -50,10 +110,20 @@ class BaseArrangement:
     def apply(self, 
         dictionary:typing.Dict[Cell, OPTIONAL_PIECES]={},
     ) -> typing.Self:
-        cls = type(self)
-        info = self.to_dict()
-        info.update(dictionary)
-        ans = cls(info)
+        data = list(self._data)
+        zobrist = self._zobrist
+        score = self._score
+        for k, v in dictionary.items():
+            if type(k) is not Cell:
+                raise TypeError(k)
+            if v is not None:
+                if type(v) is not Piece:
+                    raise TypeError(v)
+            i = INDICES[k]
+            zobrist ^= ZOBRIST[data[i]][i] ^ ZOBRIST[v][i]
+            score += SCORES[v][i] - SCORES[data[i]][i]
+            data[i] = v
+        ans = self._from_data(tuple(data), zobrist, score)
         return ans
     
     def attackers(self, 
@@ -63,15 +133,16 @@ class BaseArrangement:
         if type(cell) is not Cell:
             raise TypeError(cell)
         if player is None:
-            player = self[cell].player.invert()
+            player = self._data[INDICES[cell]].player.invert()
         if type(player) is not Player:
             raise TypeError(player)
 
+        data = self._data
         ans = set()
         for finder in consts.attackerFinders.finders(player):
             for direction in finder.directions(cell):
                 for c, pTs in direction:
-                    p = self[c]
+                    p = data[INDICES[c]]
                     if p is None:
                         continue
                     if p.player == player:
@@ -80,6 +151,9 @@ class BaseArrangement:
                     break
         return ans
     
+    def at(self, index:int) -> OPTIONAL_PIECES:
+        return self._data[index]
+
     def attacks(self,
         cell:Cell, *,
         piece:typing.Optional[Piece]=None,
@@ -87,16 +161,17 @@ class BaseArrangement:
         if type(cell) is not Cell:
             raise TypeError(cell)
         if piece is None:
-            piece = self[cell]
+            piece = self._data[INDICES[cell]]
         if piece is None:
             return set()
         if type(piece) is not Piece:
             raise TypeError(piece)
+        data = self._data
         ans = set()
         finder = consts.attackFinders.finder(piece)
         for direction in finder.directions(cell):
             for c in direction:
-                p = self[c]
+                p = data[INDICES[c]]
                 if p is None:
                     ans.add(c)
                     continue
@@ -136,6 +211,34 @@ class BaseArrangement:
     ) -> typing.List[typing.Tuple[Cell, OPTIONAL_PIECES]]:
         return list(self._zip())
     
+    @classmethod
+    def from_notation(cls, notation:str) -> typing.Self:
+        if type(notation) is not str:
+            raise TypeError(notation)
+        columns = notation.split('/')
+        if len(columns) != len(HEIGHTS):
+            raise ValueError(notation)
+        data = list()
+        for height, column in zip(HEIGHTS, columns):
+            start = len(data)
+            empty = ''
+            for char in column:
+                if char.isdigit():
+                    empty += char
+                    continue
+                if empty:
+                    data += [None] * int(empty)
+                    empty = ''
+                try:
+                    data.append(PIECES_BY_SYMBOL[char])
+                except KeyError:
+                    raise ValueError(notation) from None
+            if empty:
+                data += [None] * int(empty)
+            if len(data) - start != height:
+                raise ValueError(notation)
+        return cls._from_data(tuple(data))
+
     @classmethod
     def keys(self) -> typing.List[Cell]:
         return list(CELLS)
@@ -148,6 +251,9 @@ class BaseArrangement:
         ans = cls(dictionary)
         return ans
 
+    def score(self) -> int:
+        return self._score
+
     def text(self, *, hpad=3, vpad=0, unicode=False) -> str:
         empty = [" "] * 11
         hspacer = " " * hpad
@@ -165,6 +271,26 @@ class BaseArrangement:
         ans = vspacer.join(lines)
         return ans
     
+    def to_notation(self) -> str:
+        columns = list()
+        data = iter(self._data)
+        for height in HEIGHTS:
+            column = ''
+            empty = 0
+            for i in range(height):
+                piece = next(data)
+                if piece is None:
+                    empty += 1
+                    continue
+                if empty:
+                    column += str(empty)
+                    empty = 0
+                column += SYMBOLS[piece]
+            if empty:
+                column += str(empty)
+            columns.append(column)
+        return '/'.join(columns)
+
     def to_dict(self) -> typing.Dict[str, OPTIONAL_PIECES]:
         return dict(self._zip())
     
@@ -178,6 +304,9 @@ class BaseArrangement:
                 ans.add(c)
         return ans
 
+    def zobrist(self) -> int:
+        return self._zobrist
+
 
 
 class Arrangement(BaseArrangement):
@@ -186,13 +315,18 @@ class Arrangement(BaseArrangement):
     ) -> None:
         data = [None] * len(CELLS)
         for k, v in dictionary.items():
-            i = CELLS.index(k)
+            if type(k) is not Cell:
+                raise TypeError(k)
+            i = INDICES[k]
             if v is not None:
                 if type(v) is not Piece:
                     raise TypeError(v)
             data[i] = v
+        data = tuple(data)
         super().__init__(
-            _data=tuple(data),
+            _data=data,
+            _zobrist=self._hash_data(data),
+            _score=self._score_data(data),
         )
     def __repr__(self) -> str:
         return str(self)
@@ -1,7 +1,5 @@
 import typing
-from dataclasses import dataclass
-
-from isometric import Vector
+from dataclasses import dataclass, field
 
 from glinski._enums import *
 
@@ -9,46 +7,32 @@ from .motions import *
 
 __all__ = ['AttackFinder']
 
+DIRECTIONS = typing.Tuple[typing.Tuple[Cell, ...], ...]
+
 @dataclass(frozen=True)
 class BaseAttackFinder:
     # fields
     maxfactor: int
     motions: typing.FrozenSet[Motion]
+    _directions: typing.Dict[Cell, DIRECTIONS] = field(
+        compare=False,
+        repr=False,
+    )
 
     # methods
-    #   private
-    def _direction(self, 
-        origin:Cell, *,
-        unit:Vector,
-    ) -> typing.Generator[Cell, None, None]:
-        generator = origin.count_up(
-            start=1,
-            stop=self.maxfactor+1,
-            vector=unit,
-        )
-        for n, cell in generator:
-            yield cell
-    
     #   public
-    def directions(self, 
-        origin:Cell,
-    ) -> typing.Generator[
-        typing.Generator[Cell, None, None],
-        None,
-        None,
-    ]:
-        if type(origin) is not Cell:
-            raise TypeError(origin)
-        for m in self.motions:
-            for u in m:
-                yield self._direction(origin, unit=u)
+    def directions(self, origin:Cell) -> DIRECTIONS:
+        try:
+            return self._directions[origin]
+        except KeyError:
+            raise TypeError(origin) from None
     
     @property
     def radii(self):
         return frozenset(abs(m) for m in self.motions)
 
     
-
+    
 
 class AttackFinder(BaseAttackFinder):
     def __init__(self, 
@@ -61,7 +45,16 @@ class AttackFinder(BaseAttackFinder):
         for motion in motions:
             if type(motion) is not Motion:
                 raise TypeError(motion)
+        directions = dict()
+        for cell in Cell:
+            directions[cell] = tuple(
+                ray[:maxfactor]
+                for m in motions
+                for ray in m.rays(cell)
+                if ray
+            )
         super().__init__(
             maxfactor=maxfactor, 
             motions=motions,
+            _directions=directions,
         )
@@ -1,7 +1,5 @@
 import typing
-from dataclasses import dataclass
-
-from isometric import Vector
+from dataclasses import dataclass, field
 
 from glinski._enums import *
 
@@ -9,36 +7,26 @@ from .motions import *
 
 __all__ = ['AttackerFinder']
 
+DIRECTIONS = typing.Tuple[
+    typing.Tuple[typing.Tuple[Cell, typing.FrozenSet[PieceKind]], ...],
+    ...
+]
+
 @dataclass(frozen=True)
 class BaseAttackerFinder:
     motion:Motion
     scaled:typing.FrozenSet[PieceKind]
     unscaled:typing.FrozenSet[PieceKind]
+    _directions:typing.Dict[Cell, DIRECTIONS] = field(
+        compare=False,
+        repr=False,
+    )
 
-    def _direction(self, *,
-        origin:Cell, 
-        unit:Vector,
-    ) -> typing.Generator[
-        typing.Tuple[Cell, typing.FrozenSet[PieceKind]], 
-        None, 
-        None,
-    ]:
-        maxfactor = 100 if len(self.scaled) else 1
-        generator = origin.count_up(
-            start=1,
-            stop=maxfactor+1,
-            vector=unit,
-        )
-        for n, cell in generator:
-            if n == 1:
-                yield cell, self.scaled.union(self.unscaled)
-            else:
-                yield cell, self.scaled
-    def directions(self, origin:Cell):
-        if type(origin) is not Cell:
-            raise TypeError(origin)
-        for unit in self.motion:
-            yield self._direction(origin=origin, unit=unit)
+    def directions(self, origin:Cell) -> DIRECTIONS:
+        try:
+            return self._directions[origin]
+        except KeyError:
+            raise TypeError(origin) from None
 
 
 class AttackerFinder(BaseAttackerFinder):
@@ -56,10 +44,20 @@ class AttackerFinder(BaseAttackerFinder):
             for t in f:
                 if type(t) is not PieceKind:
                     raise TypeError(t)
+        maxfactor = 100 if len(scaled) else 1
+        kinds = [scaled | unscaled] + [scaled] * (maxfactor - 1)
+        directions = dict()
+        for cell in Cell:
+            directions[cell] = tuple(
+                tuple(zip(ray[:maxfactor], kinds))
+                for ray in motion.rays(cell)
+                if ray
+            )
         super().__init__(
             motion=motion,
             scaled=scaled,
             unscaled=unscaled,
+            _directions=directions,
         )
     
 
@@ -67,4 +65,3 @@ class AttackerFinder(BaseAttackerFinder):
 
 
 
-
@@ -0,0 +1,327 @@
+import typing
+from dataclasses import dataclass
+
+from isometric import Vector
+
+from glinski._consts import *
+from glinski._enums import *
+
+from .arrangements import *
+from .motions import *
+from .pieces import *
+
+# __all__
+__all__ = ['BitboardArrangement']
+
+
+# global constants
+CELLS = tuple(Cell)
+INDICES = {cell:i for i, cell in enumerate(CELLS)}
+BITS = tuple(1 << i for i in range(len(CELLS)))
+FULL = (1 << len(CELLS)) - 1
+PIECES = tuple(
+    Piece.by_items(kind=kind, player=player)
+    for player in Player
+    for kind in PieceKind
+)
+PIECE_INDICES = {piece:i for i, piece in enumerate(PIECES)}
+OPTIONAL_PIECES = typing.Optional[Piece]
+SLIDERS = typing.Tuple[typing.Tuple[bool, typing.Tuple[int, ...]], ...]
+
+def _mask(cells:typing.Iterable[Cell]) -> int:
+    ans = 0
+    for cell in cells:
+        ans |= BITS[INDICES[cell]]
+    return ans
+
+def _leaps(*motions:Motion) -> typing.Tuple[int, ...]:
+    ans = list()
+    for cell in CELLS:
+        ans.append(_mask(
+            ray[0]
+            for motion in motions
+            for ray in motion.rays(cell)
+            if ray
+        ))
+    return tuple(ans)
+
+def _sliders(motion:Motion) -> SLIDERS:
+    ans = list()
+    for j in range(len(motion)):
+        rays = [motion.rays(cell)[j] for cell in CELLS]
+        ascending = all(
+            INDICES[ray[0]] > i
+            for i, ray in enumerate(rays)
+            if ray
+        )
+        masks = tuple(_mask(ray) for ray in rays)
+        ans.append((ascending, masks))
+    return tuple(ans)
+
+def _slide(sliders:SLIDERS, index:int, occupancy:int) -> int:
+    ans = 0
+    for ascending, masks in sliders:
+        ray = masks[index]
+        blockers = ray & occupancy
+        if blockers:
+            if ascending:
+                blockers &= -blockers
+            ray ^= masks[blockers.bit_length() - 1]
+        ans |= ray
+    return ans
+
+DIAGONALS = _sliders(consts.motions.DIAGONAL)
+FILES = _sliders(consts.motions.FILE)
+KNIGHT_LEAPS = _leaps(consts.motions.HORSE)
+KING_LEAPS = _leaps(consts.motions.DIAGONAL, consts.motions.FILE)
+PAWN_LEAPS_BY_PLAYER = {
+    player:_leaps(consts.motions.PAWN_ATTACKS_BY_PLAYER[player])
+    for player in Player
+}
+RAYS_BY_UNIT = dict()
+for _motion in (consts.motions.DIAGONAL, consts.motions.FILE):
+    for _unit, (_ascending, _masks) in zip(_motion, _sliders(_motion)):
+        RAYS_BY_UNIT[_unit] = _masks
+VFLIPS = tuple(INDICES[cell.vflip()] for cell in CELLS)
+OFFSETS_BY_PLAYER = {
+    player:PIECE_INDICES[Piece.by_items(kind=PieceKind.PAWN, player=player)]
+    for player in Player
+}
+
+
+# BitboardArrangement
+@dataclass(frozen=True)
+class BaseBitboardArrangement:
+    # fields
+    _masks:typing.Tuple[int, ...]
+
+    # methods
+    #   dunder
+    def __getitem__(self, key:Cell) -> OPTIONAL_PIECES:
+        if type(key) is not Cell:
+            raise TypeError(key)
+        return self.at(INDICES[key])
+
+    #   protected
+    @classmethod
+    def _from_masks(cls, masks:typing.Iterable[int]) -> typing.Self:
+        ans = object.__new__(cls)
+        BaseBitboardArrangement.__init__(ans, _masks=tuple(masks))
+        return ans
+
+    def _control(self, index:int, piece:Piece) -> int:
+        kind = piece.kind
+        if kind == PieceKind.PAWN:
+            return PAWN_LEAPS_BY_PLAYER[piece.player][index]
+        if kind == PieceKind.KNIGHT:
+            return KNIGHT_LEAPS[index]
+        if kind == PieceKind.KING:
+            return KING_LEAPS[index]
+        occupancy = self.occupancy()
+        ans = 0
+        if kind != PieceKind.ROOK:
+            ans |= _slide(DIAGONALS, index, occupancy)
+        if kind != PieceKind.BISHOP:
+            ans |= _slide(FILES, index, occupancy)
+        return ans
+
+    def _zip(self) -> typing.Iterable[typing.Tuple[Cell, OPTIONAL_PIECES]]:
+        data = [None] * len(CELLS)
+        for piece, mask in zip(PIECES, self._masks):
+            while mask:
+                bit = mask & -mask
+                data[bit.bit_length() - 1] = piece
+                mask ^= bit
+        return zip(CELLS, data)
+
+    #   public
+    def at(self, index:int) -> OPTIONAL_PIECES:
+        bit = BITS[index]
+        for piece, mask in zip(PIECES, self._masks):
+            if mask & bit:
+                return piece
+        return None
+
+    def attacked(self, player:Player) -> int:
+        if type(player) is not Player:
+            raise TypeError(player)
+        ans = 0
+        for piece, mask in zip(PIECES, self._masks):
+            if piece.player != player:
+                continue
+            while mask:
+                bit = mask & -mask
+                ans |= self._control(bit.bit_length() - 1, piece)
+                mask ^= bit
+        return ans
+
+    def attackers(self,
+        cell:Cell, *,
+        player:typing.Optional[Player]=None,
+    ) -> typing.Set[Cell]:
+        if type(cell) is not Cell:
+            raise TypeError(cell)
+        if player is None:
+            player = self[cell].player.invert()
+        ans = self.attackers_mask(INDICES[cell], player=player)
+        return self.cells(ans)
+
+    def attackers_mask(self, index:int, *, player:Player) -> int:
+        if type(player) is not Player:
+            raise TypeError(player)
+        offset = OFFSETS_BY_PLAYER[player]
+        pawns, knights, bishops, rooks, queens, kings = self._masks[
+            offset:offset+len(PieceKind)
+        ]
+        occupancy = self.occupancy()
+        ans = PAWN_LEAPS_BY_PLAYER[player.invert()][index] & pawns
+        ans |= KNIGHT_LEAPS[index] & knights
+        ans |= KING_LEAPS[index] & kings
+        if bishops | queens:
+            ans |= _slide(DIAGONALS, index, occupancy) & (bishops | queens)
+        if rooks | queens:
+            ans |= _slide(FILES, index, occupancy) & (rooks | queens)
+        return ans
+
+    def attacks(self,
+        cell:Cell, *,
+        piece:typing.Optional[Piece]=None,
+    ) -> typing.Set[Cell]:
+        if type(cell) is not Cell:
+            raise TypeError(cell)
+        if piece is None:
+            piece = self[cell]
+        if piece is None:
+            return set()
+        if type(piece) is not Piece:
+            raise TypeError(piece)
+        ans = self._control(INDICES[cell], piece)
+        ans &= ~self.occupancy(piece.player)
+        return self.cells(ans)
+
+    @classmethod
+    def cells(cls, mask:int) -> typing.Set[Cell]:
+        ans = set()
+        while mask:
+            bit = mask & -mask
+            ans.add(CELLS[bit.bit_length() - 1])
+            mask ^= bit
+        return ans
+
+    def checkers(self, player:Player) -> typing.Set[Cell]:
+        ans = 0
+        for piece, mask in zip(PIECES, self._masks):
+            if piece.player == player:
+                continue
+            if piece.kind != PieceKind.KING:
+                continue
+            while mask:
+                bit = mask & -mask
+                ans |= self.attackers_mask(
+                    bit.bit_length() - 1,
+                    player=player,
+                )
+                mask ^= bit
+        return self.cells(ans)
+
+    @classmethod
+    def from_arrangement(cls, arrangement:Arrangement) -> typing.Self:
+        if type(arrangement) is not Arrangement:
+            raise TypeError(arrangement)
+        masks = [0] * len(PIECES)
+        for i, piece in enumerate(arrangement.values()):
+            if piece is not None:
+                masks[PIECE_INDICES[piece]] |= BITS[i]
+        return cls._from_masks(masks)
+
+    def invert(self) -> typing.Self:
+        masks = [0] * len(PIECES)
+        for piece, mask in zip(PIECES, self._masks):
+            j = PIECE_INDICES[piece.invert()]
+            while mask:
+                bit = mask & -mask
+                masks[j] |= BITS[VFLIPS[bit.bit_length() - 1]]
+                mask ^= bit
+        return self._from_masks(masks)
+
+    def is_check(self, turn:Player) -> bool:
+        return bool(len(self.checkers(turn.invert())))
+
+    def items(self,
+    ) -> typing.List[typing.Tuple[Cell, OPTIONAL_PIECES]]:
+        return list(self._zip())
+
+    @classmethod
+    def keys(self) -> typing.List[Cell]:
+        return list(CELLS)
+
+    def mask(self, *pieces:OPTIONAL_PIECES) -> int:
+        ans = 0
+        for piece in pieces:
+            if piece is None:
+                ans |= FULL ^ self.occupancy()
+            else:
+                ans |= self._masks[PIECE_INDICES[piece]]
+        return ans
+
+    @classmethod
+    def native(cls) -> typing.Self:
+        return cls.from_arrangement(Arrangement.native())
+
+    def occupancy(self, player:typing.Optional[Player]=None) -> int:
+        masks = self._masks
+        if player is not None:
+            offset = OFFSETS_BY_PLAYER[player]
+            masks = masks[offset:offset+len(PieceKind)]
+        ans = 0
+        for mask in masks:
+            ans |= mask
+        return ans
+
+    @classmethod
+    def ray(cls, cell:Cell, vector:Vector) -> int:
+        if type(cell) is not Cell:
+            raise TypeError(cell)
+        try:
+            masks = RAYS_BY_UNIT[vector]
+        except KeyError:
+            raise ValueError(vector) from None
+        return masks[INDICES[cell]]
+
+    def text(self, **kwargs) -> str:
+        return self.to_arrangement().text(**kwargs)
+
+    def to_arrangement(self) -> Arrangement:
+        return Arrangement(self.to_dict())
+
+    def to_dict(self) -> typing.Dict[Cell, OPTIONAL_PIECES]:
+        return dict(self._zip())
+
+    def values(self) -> typing.List[OPTIONAL_PIECES]:
+        return [v for k, v in self._zip()]
+
+    def where(self, *pieces:OPTIONAL_PIECES) -> typing.Set[Cell]:
+        return self.cells(self.mask(*pieces))
+
+
+
+class BitboardArrangement(BaseBitboardArrangement):
+    def __init__(self,
+        dictionary:typing.Dict[Cell, OPTIONAL_PIECES]={},
+    ) -> None:
+        masks = [0] * len(PIECES)
+        for k, v in dictionary.items():
+            if type(k) is not Cell:
+                raise TypeError(k)
+            if v is None:
+                continue
+            if type(v) is not Piece:
+                raise TypeError(v)
+            masks[PIECE_INDICES[v]] |= BITS[INDICES[k]]
+        super().__init__(
+            _masks=tuple(masks),
+        )
+    def __repr__(self) -> str:
+        return str(self)
+    def __str__(self) -> str:
+        return self.text()
@@ -0,0 +1,167 @@
+import typing
+
+from glinski._consts import *
+from glinski._enums import *
+from glinski._errors import *
+
+from .arrangements import *
+from .moves import *
+from .pieces import *
+from .positions import *
+
+__all__ = ['Board']
+
+CELLS = tuple(Cell)
+INDICES = {cell:i for i, cell in enumerate(CELLS)}
+ZOBRIST = consts.zobrist.PIECES
+SCORES = consts.values.SCORES
+NATIVE_POSITION = Position.native()
+OPTIONAL_PIECES = typing.Optional[Piece]
+
+class Board:
+
+    # methods
+    #   dunder
+    def __getitem__(self, key:Cell) -> OPTIONAL_PIECES:
+        if type(key) is not Cell:
+            raise TypeError(key)
+        return self._data[INDICES[key]]
+    def __init__(self, position:Position=NATIVE_POSITION) -> None:
+        if type(position) is not Position:
+            raise TypeError(position)
+        self._data = position.arrangement.values()
+        self._zobrist = position.arrangement.zobrist()
+        self._score = position.arrangement.score()
+        self._ep_column = position.ep_column
+        self._turn = position.turn
+        self._stack = list()
+    def __len__(self) -> int:
+        return len(self._stack)
+    def __repr__(self) -> str:
+        return str(self)
+    def __str__(self) -> str:
+        return self.arrangement().text()
+
+    #   protected
+    def _lookup(self, cell:Cell) -> OPTIONAL_PIECES:
+        return self._data[INDICES[cell]]
+    def _put(self, index:int, piece:OPTIONAL_PIECES) -> None:
+        self._zobrist ^= ZOBRIST[self._data[index]][index]
+        self._zobrist ^= ZOBRIST[piece][index]
+        self._score += SCORES[piece][index] - SCORES[self._data[index]][index]
+        self._data[index] = piece
+
+    #   public
+    def arrangement(self) -> Arrangement:
+        return Arrangement._from_data(
+            tuple(self._data),
+            self._zobrist,
+            self._score,
+        )
+
+    def copy(self) -> typing.Self:
+        cls = type(self)
+        ans = cls(self.position())
+        ans._stack = list(self._stack)
+        return ans
+
+    def ep_cell(self) -> typing.Optional[Cell]:
+        if self._ep_column is None:
+            return None
+        return self._ep_column.ep_cell(self._turn)
+
+    def ep_column(self) -> typing.Optional[Column]:
+        return self._ep_column
+
+    def is_anticheck(self) -> bool:
+        return self.arrangement().is_check(turn=self._turn.invert())
+
+    def is_check(self) -> bool:
+        return self.arrangement().is_check(turn=self._turn)
+
+    def legal_moves(self) -> typing.Set[Move]:
+        return self.position().legal_moves()
+
+    def moves(self) -> typing.Tuple[Move]:
+        return tuple(item[0] for item in self._stack)
+
+    def pop(self) -> Move:
+        if not len(self._stack):
+            raise IndexError
+        (
+            move, subject, target, victim, ep_column, zobrist, score,
+        ) = self._stack.pop()
+        data = self._data
+        data[INDICES[move.from_cell]] = subject
+        data[INDICES[move.to_cell]] = target
+        if victim is not None:
+            data[victim] = Piece.by_items(
+                kind=PieceKind.PAWN,
+                player=self._turn,
+            )
+        self._ep_column = ep_column
+        self._turn = self._turn.invert()
+        self._zobrist = zobrist
+        self._score = score
+        return move
+
+    def position(self) -> Position:
+        return Position(
+            arrangement=self.arrangement(),
+            ep_column=self._ep_column,
+            turn=self._turn,
+        )
+
+    def push(self, move:Move) -> None:
+        character = Position._characterize(
+            move,
+            lookup=self._lookup,
+            turn=self._turn,
+            ep_cell=self.ep_cell(),
+        )
+        ep_column = Position._ep_column_after(
+            move,
+            lookup=self._lookup,
+            subject=character.subject,
+        )
+        victim = None
+        if character.ep:
+            walk = consts.vectors.PAWN_WALKS_BY_PLAYER[self._turn]
+            victim = INDICES[self.ep_cell().apply(-walk)]
+        self._stack.append((
+            move,
+            character.subject,
+            character.target,
+            victim,
+            self._ep_column,
+            self._zobrist,
+            self._score,
+        ))
+        if move.promotion is None:
+            piece = character.subject
+        else:
+            piece = Piece.by_items(
+                kind=move.promotion,
+                player=self._turn,
+            )
+        self._put(INDICES[move.from_cell], None)
+        self._put(INDICES[move.to_cell], piece)
+        if victim is not None:
+            self._put(victim, None)
+        self._ep_column = ep_column
+        self._turn = self._turn.invert()
+
+    def score(self) -> int:
+        return self._score
+
+    def sound_moves(self) -> typing.Set[Move]:
+        return self.position().sound_moves()
+
+    def turn(self) -> Player:
+        return self._turn
+
+    def zobrist(self) -> int:
+        ans = self._zobrist
+        ans ^= consts.zobrist.EP_COLUMNS[self._ep_column]
+        ans ^= consts.zobrist.TURNS[self._turn]
+        return ans
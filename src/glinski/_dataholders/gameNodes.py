@@ -0,0 +1,161 @@
+import typing
+
+from glinski._dataholders.games import *
+from glinski._dataholders.moves import *
+from glinski._dataholders.positions import *
+from glinski._dataholders.terminations import *
+from glinski._enums import *
+from glinski._errors import *
+
+__all__ = ['GameNode']
+
+NATIVE_POSITION = Position.native()
+
+class GameNode:
+
+    # methods
+    #   dunder
+    def __init__(self, root:Position=NATIVE_POSITION) -> None:
+        if type(root) is not Position:
+            raise TypeError(root)
+        if not root.is_legal():
+            raise ValueError(root)
+        self._parent = None
+        self._move = None
+        self._position = root
+        self._ply = 0
+        self._clock = 0
+        self._repetition = 1
+        self._children = dict()
+        self._termination = None
+        self._terminated = False
+    def __len__(self) -> int:
+        return self._ply
+    def __repr__(self) -> str:
+        cls = type(self)
+        moves = ' '.join(str(m) for m in self.moves())
+        return f"{cls.__name__}({moves!r})"
+
+    #   protected
+    @classmethod
+    def _child(cls,
+        parent:typing.Self,
+        move:Move,
+        position:Position, *,
+        zeroing:bool,
+    ) -> typing.Self:
+        ans = object.__new__(cls)
+        ans._parent = parent
+        ans._move = move
+        ans._position = position
+        ans._ply = parent._ply + 1
+        ans._clock = 0 if zeroing else parent._clock + 1
+        ans._repetition = 1
+        ans._children = dict()
+        ans._termination = None
+        ans._terminated = False
+        key = position.zobrist()
+        node = ans
+        for i in range(ans._clock // 2):
+            node = node._parent._parent
+            if node._position.zobrist() == key:
+                ans._repetition = node._repetition + 1
+                break
+        return ans
+
+    def _terminate(self) -> typing.Optional[Termination]:
+        t = self._position.termination()
+        if t is not None:
+            return t
+        if self._repetition >= 5:
+            kind = TerminationKind.FIVEFOLD_REPETITION
+        elif self._clock >= 150:
+            kind = TerminationKind.SEVENTYFIVE_MOVES
+        else:
+            return None
+        return Termination(
+            kind=kind,
+            subject=self.turn().invert(),
+        )
+
+    #   public
+    def child(self, move:Move) -> typing.Optional[typing.Self]:
+        return self._children.get(move)
+
+    def children(self) -> typing.Tuple[typing.Self, ...]:
+        return tuple(self._children.values())
+
+    def game(self, *, checkpoint:int=1) -> Game:
+        ans = Game(self.root().position(), checkpoint=checkpoint)
+        ans.extend(self.moves())
+        return ans
+
+    def halfmove_clock(self) -> int:
+        return self._clock
+
+    def is_root(self) -> bool:
+        return self._parent is None
+
+    def move(self) -> typing.Optional[Move]:
+        return self._move
+
+    def moves(self) -> typing.Tuple[Move, ...]:
+        ans = list()
+        node = self
+        while node._parent is not None:
+            ans.append(node._move)
+            node = node._parent
+        return tuple(reversed(ans))
+
+    def parent(self) -> typing.Optional[typing.Self]:
+        return self._parent
+
+    def play(self, move:Move) -> typing.Self:
+        ans = self._children.get(move)
+        if ans is not None:
+            return ans
+        if self.termination() is not None:
+            raise GameAlreadyOverError
+        afterwards = self._position.apply(move)
+        if afterwards.is_anticheck():
+            raise AnticheckError(move)
+        ans = self._child(
+            self,
+            move,
+            afterwards,
+            zeroing=self._position.is_zeroing(move),
+        )
+        self._children[move] = ans
+        return ans
+
+    def position(self) -> Position:
+        return self._position
+
+    def positions(self) -> typing.Tuple[Position, ...]:
+        ans = list()
+        node = self
+        while node is not None:
+            ans.append(node._position)
+            node = node._parent
+        return tuple(reversed(ans))
+
+    def remove(self, move:Move) -> typing.Self:
+        return self._children.pop(move)
+
+    def repetition(self) -> int:
+        return self._repetition
+
+    def root(self) -> typing.Self:
+        ans = self
+        while ans._parent is not None:
+            ans = ans._parent
+        return ans
+
+    def termination(self) -> typing.Optional[Termination]:
+        if not self._terminated:
+            self._termination = self._terminate()
+            self._terminated = True
+        return self._termination
+
+    def turn(self) -> Player:
+        return self._position.turn
@@ -0,0 +1,40 @@
+import typing
+from array import array
+from dataclasses import dataclass, field
+
+from glinski._enums import *
+
+from .games import *
+from .moves import *
+from .positions import *
+
+__all__ = ['GameRecord']
+
+DERIVED_HEADERS = ('Result', 'Root')
+
+@dataclass(frozen=True, slots=True)
+class GameRecord:
+    root:Position
+    moves:array
+    result:typing.Optional[Outcome] = None
+    headers:typing.Dict[str, str] = field(default_factory=dict, compare=False)
+    def __len__(self) -> int:
+        return len(self.moves)
+    def game(self) -> Game:
+        ans = Game(self.root)
+        for code in self.moves:
+            ans.append(Move.from_code(code))
+        for k, v in self.headers.items():
+            if k not in DERIVED_HEADERS:
+                ans.headers()[k] = v
+        if self.result is None or ans.result() == self.result:
+            return ans
+        if ans.termination() is not None:
+            raise ValueError(self.result)
+        ans.adjudicate(self.result)
+        return ans
+    def keys(self) -> typing.Iterator[int]:
+        position = self.root
+        for code in self.moves:
+            yield position.zobrist()
+            position = position.apply(Move.from_code(code))
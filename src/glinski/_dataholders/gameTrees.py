@@ -0,0 +1,56 @@
+import typing
+
+from glinski._dataholders.gameNodes import *
+from glinski._dataholders.moves import *
+from glinski._dataholders.positions import *
+
+__all__ = ['GameTree']
+
+NATIVE_POSITION = Position.native()
+
+class GameTree:
+
+    # methods
+    #   dunder
+    def __init__(self, root:Position=NATIVE_POSITION) -> None:
+        self._root = GameNode(root)
+        self._node = self._root
+
+    #   public
+    def back(self, count:int=1) -> GameNode:
+        if type(count) is not int:
+            raise TypeError(count)
+        if not (0 <= count <= len(self._node)):
+            raise IndexError(count)
+        for i in range(count):
+            self._node = self._node.parent()
+        return self._node
+
+    def goto(self, node:GameNode) -> GameNode:
+        if type(node) is not GameNode:
+            raise TypeError(node)
+        if node.root() is not self._root:
+            raise ValueError(node)
+        self._node = node
+        return node
+
+    def node(self) -> GameNode:
+        return self._node
+
+    def play(self, move:Move) -> GameNode:
+        self._node = self._node.play(move)
+        return self._node
+
+    def root(self) -> GameNode:
+        return self._root
+
+    def variations(self) -> typing.List[GameNode]:
+        ans = list()
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            children = node.children()
+            if not children:
+                ans.append(node)
+            stack.extend(reversed(children))
+        return ans
@@ -1,7 +1,10 @@
+import collections
 import typing
+from array import array
 
 from glinski._dataholders.moves import *
 from glinski._dataholders.positions import *
+from glinski._dataholders.sequenceViews import *
 from glinski._dataholders.terminations import *
 from glinski._enums import *
 from glinski._errors import *
@@ -9,28 +12,78 @@ from glinski._errors import *
 __all__ = ['Game']
 
 NATIVE_POSITION = Position.native()
+CACHE_SIZE = 64
 
 class Game:
 
     # methods
     #   dunder
-    def __init__(self, root:Position=NATIVE_POSITION) -> None:
+    def __init__(self, 
+        root:Position=NATIVE_POSITION, *,
+        checkpoint:int=1,
+    ) -> None:
         if type(root) is not Position:
             raise TypeError(root)
+        if type(checkpoint) is not int:
+            raise TypeError(checkpoint)
+        if checkpoint < 1:
+            raise ValueError(checkpoint)
         if not root.is_legal():
             raise ValueError(root)
-        self._moves = list()
-        self._positions = [root]
+        self._checkpoint = checkpoint
+        self._checkpoints = [root]
+        self._cache = collections.OrderedDict()
+        self._moves = array('H')
+        self._position = root
+        self._keys = array('Q', [root.zobrist()])
+        self._clocks = array('H', [0])
+        self._counts = {root.zobrist():1}
         self._offers = dict()
+        self._termination = None
+        self._result = None
+        self._headers = dict()
+        self._terminate_by_stack()
     def __len__(self):
         return len(self._moves)
         
     #   protected
     def _assume_no_termation(self):
-        if self.termination() is not None:
+        if self.result() is not None:
             raise GameAlreadyOverError
+    def _count(self, key:int, amount:int) -> None:
+        self._counts[key] = self._counts.get(key, 0) + amount
+        if not self._counts[key]:
+            del self._counts[key]
     def _is_zeroing(self, index):
-        return self.positions()[index].is_zeroing(self.moves()[index])
+        return self._clocks[index + 1] == 0
+    def _length(self) -> int:
+        return len(self._moves) + 1
+    def _move(self, index:int) -> Move:
+        return Move.from_code(self._moves[index])
+    def _materialize(self, index:int) -> Position:
+        if index == len(self):
+            return self._position
+        ans = self._cache.get(index)
+        if ans is not None:
+            self._cache.move_to_end(index)
+            return ans
+        start, offset = divmod(index, self._checkpoint)
+        start *= self._checkpoint
+        if not offset:
+            return self._checkpoints[index // self._checkpoint]
+        for i in range(index - 1, start, -1):
+            ans = self._cache.get(i)
+            if ans is not None:
+                start = i
+                break
+        else:
+            ans = self._checkpoints[start // self._checkpoint]
+        for i in range(start, index):
+            ans = ans.apply(Move.from_code(self._moves[i]))
+        self._cache[index] = ans
+        if len(self._cache) > CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return ans
     def _terminate(self, *args, **kwargs):
         self._assume_no_termation()
         self._termination = Termination(
@@ -59,7 +112,6 @@ class Game:
         self._terminate(
             kind=t.kind,
             subject=t.subject,
-            outcome=t.outcome,
         )
         return True
     def _terminate_by_stack(self):
@@ -72,6 +124,13 @@ class Game:
 
     #   public
 
+    def adjudicate(self, outcome:Outcome) -> None:
+        if type(outcome) is not Outcome:
+            raise TypeError(outcome)
+        self._assume_no_termation()
+        self._result = outcome
+        self._offers = dict()
+
     def append(self, move:Move) -> None:
         self._assume_no_termation()
         before = self.position()
@@ -79,16 +138,34 @@ class Game:
         if afterwards.is_anticheck():
             raise AnticheckError(move)
         self._offers.pop(afterwards.turn, None)
-        self._moves.append(move)
-        self._positions.append(afterwards)
+        if before.is_zeroing(move):
+            self._clocks.append(0)
+            self._counts = dict()
+        else:
+            self._clocks.append(self._clocks[-1] + 1)
+        self._moves.append(move.code())
+        self._position = afterwards
+        if not len(self) % self._checkpoint:
+            self._checkpoints.append(afterwards)
+        self._keys.append(afterwards.zobrist())
+        self._count(afterwards.zobrist(), 1)
         self._terminate_by_stack()
     
     def copy(self) -> typing.Self:
         cls = type(self)
-        ans = cls(self.root())
-        for m in self.moves():
-            ans.append(m)
+        ans = object.__new__(cls)
+        ans._checkpoint = self._checkpoint
+        ans._checkpoints = list(self._checkpoints)
+        ans._cache = collections.OrderedDict(self._cache)
+        ans._moves = array('H', self._moves)
+        ans._position = self._position
+        ans._keys = array('Q', self._keys)
+        ans._clocks = array('H', self._clocks)
+        ans._counts = dict(self._counts)
         ans._offers = dict(self._offers)
+        ans._termination = self._termination
+        ans._result = self._result
+        ans._headers = dict(self._headers)
         return ans
 
     def current_offer_by(self, player:Player):
@@ -101,55 +178,75 @@ class Game:
             self.append(move)
 
     def halfmove_clock(self) -> int:
-        l = len(self)
-        for j in range(l):
-            i = l - j - 1
-            if self._is_zeroing(i):
-                return j
-        return l
-
-    def moves(self) -> typing.Tuple[Move]:
-        return tuple(self._moves)
+        return self._clocks[-1]
+
+    def headers(self) -> typing.Dict[str, str]:
+        return self._headers
+
+    def keys(self) -> array:
+        return array('Q', self._keys)
+
+    def move_codes(self) -> array:
+        return array('H', self._moves)
+
+    def moves(self) -> SequenceView:
+        return SequenceView(self._move, self.__len__)
     
     def pop(self) -> Move:
         ans, = self.rewind(1)
         return ans
     
     def position(self) -> Position:
-        return self.positions()[-1]
+        return self._position
 
-    def positions(self) -> typing.Tuple[Position]:
-        return tuple(self._positions)
+    def positions(self) -> SequenceView:
+        return SequenceView(self._materialize, self._length)
     
     def repetition(self) -> int:
-        lastpositions = self.positions()[-self.halfmove_clock():]
-        ans = 0
-        for p in lastpositions:
-            if p == self.positions()[-1]:
-                ans += 1
-        return ans
+        return self._counts[self.position().zobrist()]
     
     def rewind(self, count:int) -> typing.List[Move]:
         if type(count) is not int:
             raise TypeError(count)
         if not (0 <= count <= len(self)):
             raise IndexError(count)
-        ans = self.moves()[-count:]
+        l = len(self) - count
+        ans = [Move.from_code(code) for code in self._moves[l:]]
+        rebuild = 0 in self._clocks[l + 1:]
+        if not rebuild:
+            for key in self._keys[l + 1:]:
+                self._count(key, -1)
         self._offers = dict()
-        self._moves = self.moves()[:-count]
-        self._positions = self.positions()[:-count]
+        self._position = self._materialize(l)
+        del self._moves[l:]
+        del self._keys[l + 1:]
+        del self._clocks[l + 1:]
+        del self._checkpoints[l // self._checkpoint + 1:]
+        for i in list(self._cache.keys()):
+            if i >= l:
+                del self._cache[i]
+        if rebuild:
+            self._counts = dict()
+            for key in self._keys[l - self._clocks[-1]:]:
+                self._count(key, 1)
         self._termination = None
+        self._result = None
         self._terminate_by_stack()
         return ans
     
+    def result(self) -> typing.Optional[Outcome]:
+        if self._termination is not None:
+            return self._termination.outcome
+        return self._result
+
     def root(self):
-        return self.positions()[0]
+        return self._checkpoints[0]
     
     def termination(self):
         return self._termination
     
     def turn(self):
-        return self.position().turn()
+        return self.position().turn
 
 
 
@@ -1,5 +1,5 @@
 import typing
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from isometric import Vector
 
@@ -7,11 +7,14 @@ from glinski._enums import *
 
 __all__ = ['Motion']
 
-@dataclass(frozen=True)
+RAYS = typing.Dict[Cell, typing.Tuple[typing.Tuple[Cell, ...], ...]]
+
+@dataclass(frozen=True, slots=True)
 class BaseMotion:
     # fields
     _abs: float
     _items: typing.FrozenSet[Vector]
+    _rays: RAYS = field(compare=False, repr=False)
     # methods
     #   dunder
     def __abs__(self):
@@ -20,9 +23,15 @@ class BaseMotion:
         return iter(self._items)
     def __len__(self):
         return len(self._items)
+    #   public
+    def rays(self, 
+        origin:Cell,
+    ) -> typing.Tuple[typing.Tuple[Cell, ...], ...]:
+        return self._rays[origin]
 
 
 class Motion(BaseMotion):
+    __slots__ = ()
     def __init__(self, unit:Vector, *, rotate:bool) -> None:
         if type(unit) is not Vector:
             raise TypeError(unit)
@@ -37,8 +46,15 @@ class Motion(BaseMotion):
         for hand in hands:
             for rotation in rotations:
                 items.add(hand.rotate(rotation))
+        items = frozenset(items)
+        rays = dict()
+        for cell in Cell:
+            rays[cell] = tuple(
+                tuple(c for n, c in cell.count_up(start=1, vector=u))
+                for u in items
+            )
         super().__init__(
             _abs=float(abs(unit)),
-            _items=frozenset(items),
+            _items=items,
+            _rays=rays,
         )
-
@@ -7,7 +7,7 @@ from .pieces import *
 
 __all__ = ['MoveCharacter']
 
-@dataclass
+@dataclass(slots=True)
 class MoveCharacter:
     subject:typing.Optional[Piece] = None
     target:typing.Optional[Piece] = None
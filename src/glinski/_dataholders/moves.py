@@ -1,9 +1,10 @@
 import string
 import typing
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from isometric import Vector
 
+from glinski._consts import *
 from glinski._enums import *
 
 from .pieces import *
@@ -16,24 +17,189 @@ PROMOTIONS_BY_UCI_NOTATION = dict(
     r = PieceKind.ROOK,
     q = PieceKind.QUEEN,
 )
+UCI_NOTATIONS_BY_PROMOTION = {
+    v:k for k, v in PROMOTIONS_BY_UCI_NOTATION.items()
+}
 OPTIONAL_PIECEKIND = typing.Optional[PieceKind]
+CELLS = tuple(Cell)
+INDICES = {cell:i for i, cell in enumerate(CELLS)}
+PROMOTIONS = (None,) + tuple(PieceKind)
+PROMOTION_INDICES = {kind:i for i, kind in enumerate(PROMOTIONS)}
+CODES = len(CELLS) * len(CELLS) * len(PROMOTIONS)
+MOVES = [None] * CODES
 
-def _pieces(*kinds:PieceKind):
-    return {
-        Piece(kind=t, player=p)
-        for t in kinds
-        for p in Player
-    }
+def _code(
+    from_cell:Cell, 
+    to_cell:Cell, 
+    promotion:OPTIONAL_PIECEKIND,
+) -> int:
+    ans = INDICES[from_cell] * len(CELLS) + INDICES[to_cell]
+    ans = ans * len(PROMOTIONS) + PROMOTION_INDICES[promotion]
+    return ans
 
-@dataclass(frozen=True)
+PIECES = tuple(
+    Piece.by_items(kind=kind, player=player)
+    for player in Player
+    for kind in PieceKind
+)
+PIECE_BITS = {piece:1 << i for i, piece in enumerate(PIECES)}
+
+def _pieces(*kinds:PieceKind) -> int:
+    ans = 0
+    for kind in kinds:
+        for player in Player:
+            ans |= PIECE_BITS[Piece.by_items(kind=kind, player=player)]
+    return ans
+
+def _pawn(player:Player) -> int:
+    return PIECE_BITS[Piece.by_items(kind=PieceKind.PAWN, player=player)]
+
+def _tables() -> typing.Tuple[tuple, tuple, tuple]:
+    suspects = [0] * len(CELLS) ** 2
+    promotions = [0] * len(CELLS) ** 2
+    between = [None] * len(CELLS) ** 2
+    horse = consts.motions.HORSE
+    diagonal = consts.motions.DIAGONAL
+    file = consts.motions.FILE
+    for i, cell in enumerate(CELLS):
+        offset = i * len(CELLS)
+        for ray in horse.rays(cell):
+            if ray:
+                pair = offset + INDICES[ray[0]]
+                suspects[pair] = _pieces(PieceKind.KNIGHT)
+                between[pair] = ()
+        for unit, ray in zip(diagonal, diagonal.rays(cell)):
+            digest = unit.digest()
+            for n, c in enumerate(ray, 1):
+                pair = offset + INDICES[c]
+                between[pair] = ray[:n - 1]
+                suspects[pair] = _pieces(PieceKind.BISHOP, PieceKind.QUEEN)
+                if n > 1:
+                    continue
+                suspects[pair] |= _pieces(PieceKind.KING)
+                if digest.y == 0:
+                    continue
+                player = Player(digest.y > 0)
+                if c.promotion(player):
+                    promotions[pair] = _pawn(player)
+                else:
+                    suspects[pair] |= _pawn(player)
+        for unit, ray in zip(file, file.rays(cell)):
+            digest = unit.digest()
+            player = Player(digest.y > 0)
+            for n, c in enumerate(ray, 1):
+                pair = offset + INDICES[c]
+                between[pair] = ray[:n - 1]
+                suspects[pair] = _pieces(PieceKind.ROOK, PieceKind.QUEEN)
+                if n > 2:
+                    continue
+                if n == 2:
+                    if digest.x != 0:
+                        continue
+                    if cell.native() != Piece.by_items(
+                        kind=PieceKind.PAWN,
+                        player=player,
+                    ):
+                        continue
+                    suspects[pair] |= _pawn(player)
+                    continue
+                suspects[pair] |= _pieces(PieceKind.KING)
+                if c.promotion(player):
+                    promotions[pair] = _pawn(player)
+                else:
+                    suspects[pair] |= _pawn(player)
+        if cell.promotion() is not None:
+            promotions[offset:offset + len(CELLS)] = [0] * len(CELLS)
+    return tuple(suspects), tuple(promotions), tuple(between)
+
+def _frozen(
+    masks:typing.Tuple[int, ...],
+) -> typing.Tuple[typing.FrozenSet[Piece], ...]:
+    sets = dict()
+    ans = list()
+    for mask in masks:
+        if mask not in sets:
+            sets[mask] = frozenset(
+                piece for piece in PIECES
+                if mask & PIECE_BITS[piece]
+            )
+        ans.append(sets[mask])
+    return tuple(ans)
+
+SUSPECT_MASKS, PROMOTION_SUSPECT_MASKS, BETWEEN = _tables()
+SUSPECTS = _frozen(SUSPECT_MASKS)
+PROMOTION_SUSPECTS = _frozen(PROMOTION_SUSPECT_MASKS)
+NO_SUSPECTS = frozenset()
+
+@dataclass(frozen=True, slots=True)
 class BaseMove:
     # fields
     from_cell: Cell
     to_cell: Cell
     promotion: OPTIONAL_PIECEKIND
+    _code: int = field(compare=False, repr=False)
 
     # methods
+    #   dunder
+    def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._code == other._code
+
+    def __hash__(self) -> int:
+        return self._code
+
+    #   protected
+    def _walk(self) -> typing.List[Cell]:
+        w = self.vector().factorize()[1]
+        c = self.from_cell
+        ans = list()
+        while c != self.to_cell:
+            ans.append(c)
+            c = c.apply(w)
+        return ans
+
     #   public
+    @classmethod
+    def by_cells(cls, 
+        from_cell:Cell, 
+        to_cell:Cell, 
+        promotion:OPTIONAL_PIECEKIND=None,
+    ) -> typing.Self:
+        try:
+            code = _code(from_cell, to_cell, promotion)
+        except KeyError:
+            return cls(
+                from_cell=from_cell,
+                to_cell=to_cell,
+                promotion=promotion,
+            )
+        return cls.from_code(code)
+
+    def code(self) -> int:
+        return self._code
+
+    @classmethod
+    def from_code(cls, code:int) -> typing.Self:
+        if type(code) is not int:
+            raise TypeError(code)
+        if not (0 <= code < CODES):
+            raise ValueError(code)
+        ans = MOVES[code]
+        if ans is not None:
+            return ans
+        rest, promotion = divmod(code, len(PROMOTIONS))
+        from_index, to_index = divmod(rest, len(CELLS))
+        ans = cls(
+            from_cell=CELLS[from_index],
+            to_cell=CELLS[to_index],
+            promotion=PROMOTIONS[promotion],
+        )
+        MOVES[code] = ans
+        return ans
+
     @classmethod
     def from_uci(cls, value) -> typing.Optional[typing.Self]:
         value = str(value)
@@ -51,90 +217,30 @@ class BaseMove:
         else:
             from_cell = Cell[value[:2]]
             to_cell = Cell[value[2:]]
-        ans = cls(
-            from_cell=from_cell,
-            to_cell=to_cell,
-            promotion=promotion,
-        )
+        ans = cls.by_cells(from_cell, to_cell, promotion)
         return ans
 
-    def suspects(self) -> typing.Set[Piece]:
-        if self.promotion in {PieceKind.PAWN, PieceKind.KING}:
-            return set()
-        if self.promotion is not None:
-            if self.from_cell.promotion() is not None:
-                return set()
-            p = self.to_cell.promotion()
-            if p is None:
-                return set()
-            return {
-                Piece(
-                    player=p,
-                    kind=PieceKind.PAWN,
-                )
-            }
-        if self.from_cell == self.to_cell:
-            return set()
-        v = self.vector()
-        n, w = v.factorize()
-        a = float(abs(w))
-        s = w.digest().y
-        if a == 7 ** .5:
-            if n > 1:
-                return set()
-            return _pieces(
-                PieceKind.KNIGHT,
-            )
-        if a == 3 ** .5:
-            ans = _pieces(
-                PieceKind.BISHOP, 
-                PieceKind.QUEEN,
-            )
-            if n > 1:
-                return ans
-            ans |= _pieces(PieceKind.KING)
-            if s == 0:
-                return ans
-            p = Player(s > 0)
-            if self.to_cell.promotion(p):
-                return ans
-            ans.add(Piece(kind=PieceKind.PAWN, player=p))
-            return ans
-        if a == 1 ** .5:
-            ans = _pieces(
-                PieceKind.ROOK, 
-                PieceKind.QUEEN,
-            )
-            if n > 2:
-                return ans
-            if n == 2:
-                if w.digest().x != 0:
-                    return ans
-                native = self.from_cell.native()
-                if native is None:
-                    return ans
-                if native.kind != PieceKind.PAWN:
-                    return ans
-                if native.player != Player(w.digest().y > 0):
-                    return ans
-                ans.add(native)
-                return ans
-            ans |= _pieces(PieceKind.KING)
-            p = Player(s > 0)
-            if self.to_cell.promotion(p):
-                return ans
-            ans.add(Piece(kind=PieceKind.PAWN, player=p))
-            return ans
-        return set()
+    def between(self) -> typing.Tuple[Cell, ...]:
+        ans = BETWEEN[self._code // len(PROMOTIONS)]
+        if ans is None:
+            return tuple(self._walk()[1:])
+        return ans
+
+    def suspects(self) -> typing.FrozenSet[Piece]:
+        pair, promotion = divmod(self._code, len(PROMOTIONS))
+        if not promotion:
+            return SUSPECTS[pair]
+        if self.promotion.promotion():
+            return PROMOTION_SUSPECTS[pair]
+        return NO_SUSPECTS
 
     def trajectory(self) -> typing.List[Cell]:
-        w = self.vector().factorize()[1]
-        c = self.from_cell
-        ans = list()
-        while c != self.to_cell:
-            ans.append(c)
-            c = c.apply(w)
-        return ans
+        if self.from_cell == self.to_cell:
+            return []
+        ans = BETWEEN[self._code // len(PROMOTIONS)]
+        if ans is None:
+            return self._walk()
+        return [self.from_cell, *ans]
             
     def vector(self) -> Vector:
         return self.from_cell.vector_to(self.to_cell)
@@ -146,6 +252,7 @@ class BaseMove:
 
 
 class Move(BaseMove):
+    __slots__ = ()
     # methods
     #   dunder
     def __init__(self, *,
@@ -163,6 +270,7 @@ class Move(BaseMove):
             from_cell=from_cell,
             to_cell=to_cell,
             promotion=promotion,
+            _code=_code(from_cell, to_cell, promotion),
         )
     def __repr__(self) -> str:
         return str(self)
@@ -171,10 +279,7 @@ class Move(BaseMove):
         ans += self.from_cell.name
         ans += self.to_cell.name
         if self.promotion is not None:
-            for k, v in PROMOTIONS_BY_UCI_NOTATION.items():
-                if v == self.promotion:
-                    ans += k
-                    break
+            ans += UCI_NOTATIONS_BY_PROMOTION.get(self.promotion, '')
         return ans
 
     
\ No newline at end of file
@@ -0,0 +1,131 @@
+import mmap
+import os
+import random
+import struct
+import typing
+from dataclasses import dataclass
+
+from .moves import *
+from .positions import *
+
+__all__ = ['BookEntry', 'OpeningBook']
+
+MAGIC = b'GLOB'
+HEADER = struct.Struct('<4sI')
+RECORD = struct.Struct('<QHHIII')
+KEY = struct.Struct('<Q')
+MAX_WEIGHT = 0xFFFF
+MAX_COUNT = 0xFFFFFFFF
+
+@dataclass(frozen=True, slots=True)
+class BookEntry:
+    move:Move
+    weight:int
+    wins:int
+    draws:int
+    losses:int
+    def games(self) -> int:
+        return self.wins + self.draws + self.losses
+    def score(self) -> typing.Optional[float]:
+        games = self.games()
+        if not games:
+            return None
+        return (self.wins + self.draws / 2) / games
+
+class OpeningBook:
+
+    # methods
+    #   dunder
+    def __contains__(self, position:Position) -> bool:
+        if type(position) is not Position:
+            raise TypeError(position)
+        key = position.zobrist()
+        i = self._lower(key)
+        return i < self._count and self._key(i) == key
+    def __enter__(self) -> typing.Self:
+        return self
+    def __exit__(self, *args) -> None:
+        self.close()
+    def __init__(self, path:typing.Union[str, os.PathLike]) -> None:
+        self._file = open(path, 'rb')
+        try:
+            self._data = mmap.mmap(
+                self._file.fileno(),
+                0,
+                access=mmap.ACCESS_READ,
+            )
+        except ValueError:
+            self._file.close()
+            raise
+        try:
+            magic, self._count = HEADER.unpack_from(self._data)
+        except struct.error:
+            self.close()
+            raise ValueError(path) from None
+        size = HEADER.size + self._count * RECORD.size
+        if magic != MAGIC or len(self._data) != size:
+            self.close()
+            raise ValueError(path)
+    def __len__(self) -> int:
+        return self._count
+
+    #   protected
+    def _key(self, i:int) -> int:
+        return KEY.unpack_from(self._data, HEADER.size + i * RECORD.size)[0]
+
+    def _lower(self, key:int) -> int:
+        lo = 0
+        hi = self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    #   public
+    def choose(self,
+        position:Position, *,
+        rng:typing.Optional[random.Random]=None,
+    ) -> typing.Optional[Move]:
+        entries = [e for e in self.entries(position) if e.weight]
+        if not entries:
+            return None
+        if rng is None:
+            rng = random
+        ans, = rng.choices(
+            [e.move for e in entries],
+            weights=[e.weight for e in entries],
+        )
+        return ans
+
+    def close(self) -> None:
+        if not self._data.closed:
+            self._data.close()
+        self._file.close()
+
+    def entries(self, position:Position) -> typing.List[BookEntry]:
+        if type(position) is not Position:
+            raise TypeError(position)
+        key = position.zobrist()
+        start = self._lower(key)
+        stop = start
+        while stop < self._count and self._key(stop) == key:
+            stop += 1
+        offset = HEADER.size + start * RECORD.size
+        with memoryview(self._data) as view:
+            records = view[offset:offset + (stop - start) * RECORD.size]
+            ans = [
+                BookEntry(
+                    move=Move.from_code(code),
+                    weight=weight,
+                    wins=wins,
+                    draws=draws,
+                    losses=losses,
+                )
+                for k, code, weight, wins, draws, losses
+                in RECORD.iter_unpack(records)
+            ]
+            records.release()
+        return ans
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import typing
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from glinski._enums.pieces import *
 from glinski._enums.players import *
@@ -16,30 +16,45 @@ WHITE_SYMBOLS = {
     PieceKind.QUEEN:'Q',
     PieceKind.KING:'K',
 }
+PIECES = None
+PIECES_BY_ITEMS = None
+PIECES_BY_SYMBOL = None
 
-@dataclass(frozen=True)
+def _index(kind:PieceKind, player:Player) -> int:
+    return int(player.value) * len(PieceKind) + kind.value - 1
+
+@dataclass(frozen=True, slots=True)
 class BasePiece:
     kind:PieceKind
     player:Player
+    _index:int = field(compare=False, repr=False)
+    def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._index == other._index
+    def __hash__(self) -> int:
+        return self._index
+    @classmethod
+    def by_items(cls, *, kind:PieceKind, player:Player) -> Piece:
+        try:
+            return PIECES_BY_ITEMS[kind, player]
+        except KeyError:
+            pass
+        if type(kind) is not PieceKind:
+            raise TypeError(kind)
+        raise TypeError(player)
     @classmethod
     def from_symbol(cls, symbol: str) -> Piece:
         if type(symbol) is not str:
             raise TypeError(symbol)
-        for kind, white_symbol in WHITE_SYMBOLS.items():
-            if white_symbol != symbol.upper():
-                continue
-            return cls(
-                kind=kind,
-                player=Player(white_symbol == symbol),
-            )
-        raise ValueError(symbol)
+        try:
+            return PIECES_BY_SYMBOL[symbol]
+        except KeyError:
+            raise ValueError(symbol) from None
     def invert(self) -> typing.Self:
-        cls = type(self)
-        ans = cls(
-            kind=self.kind,
-            player=self.player.invert(),
-        )
-        return ans
+        return PIECES[(self._index + len(PieceKind)) % len(PIECES)]
     def symbol(self) -> str:
         ans = WHITE_SYMBOLS[self.kind]
         if self.player == Player.BLACK:
@@ -53,8 +68,9 @@ class BasePiece:
         return ans
 
 class Piece(BasePiece):
-    def __init__(self, *, 
-        kind:PieceKind, 
+    __slots__ = ()
+    def __init__(self, *,
+        kind:PieceKind,
         player:Player,
     ):
         if type(kind) is not PieceKind:
@@ -64,5 +80,13 @@ class Piece(BasePiece):
         super().__init__(
             kind=kind,
             player=player,
+            _index=_index(kind, player),
         )
-    
+
+PIECES = tuple(
+    Piece(kind=kind, player=player)
+    for player in Player
+    for kind in PieceKind
+)
+PIECES_BY_ITEMS = {(p.kind, p.player):p for p in PIECES}
+PIECES_BY_SYMBOL = {p.symbol():p for p in PIECES}
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
+import itertools
 import typing
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, field
 
 from glinski._consts import *
 from glinski._enums import *
 from glinski._errors import *
 
 from .arrangements import *
+from .bitboardArrangements import *
 from .moveCharacters import *
 from .moves import *
 from .pieces import *
@@ -18,6 +20,23 @@ __all__ = ['Position']
 
 
 DEFAULT_ARRANGEMENT = Arrangement()
+NIBBLES = {None:0}
+for player in Player:
+    for kind in PieceKind:
+        NIBBLES[Piece.by_items(kind=kind, player=player)] = (
+            kind.value | (0 if player.value else 8)
+        )
+PIECES_BY_NIBBLE = {v:k for k, v in NIBBLES.items()}
+PAIRS = tuple(
+    (PIECES_BY_NIBBLE[b >> 4], PIECES_BY_NIBBLE[b & 15])
+    if (b >> 4) in PIECES_BY_NIBBLE and (b & 15) in PIECES_BY_NIBBLE
+    else None
+    for b in range(256)
+)
+COLUMNS = (None,) + tuple(Column)
+SIZE = 1 + (len(Cell) + 1) // 2
+TURN_SYMBOLS = {Player.WHITE:'w', Player.BLACK:'b'}
+PLAYERS_BY_SYMBOL = {v:k for k, v in TURN_SYMBOLS.items()}
 
 @dataclass(frozen=True)
 class BasePosition:
@@ -26,33 +45,55 @@ class BasePosition:
     arrangement:Arrangement
     ep_column:typing.Optional[Column]
     turn:Player
+    _zobrist:int = field(compare=False, repr=False)
 
     # method
 
+    #   dunder
+    def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+        if type(other) is not type(self):
+            return NotImplemented
+        if self._zobrist != other._zobrist:
+            return False
+        if self.turn != other.turn:
+            return False
+        if self.ep_column != other.ep_column:
+            return False
+        return self.arrangement == other.arrangement
+
+    def __hash__(self) -> int:
+        return self._zobrist
+
     #   protected
-    
-    def _moveCharacter(self, move:Move) -> MoveCharacter:
+    @classmethod
+    def _characterize(cls, 
+        move:Move, *,
+        lookup:typing.Callable[[Cell], typing.Optional[Piece]],
+        turn:Player,
+        ep_cell:typing.Optional[Cell],
+    ) -> MoveCharacter:
         if type(move) is not Move:
             raise TypeError(move)
         ans = MoveCharacter()
-        ans.subject = self.arrangement[move.from_cell]
+        ans.subject = lookup(move.from_cell)
         suspects = move.suspects()
         if ans.subject not in suspects:
             raise UnsoundMoveError
-        if ans.subject.player != self.turn:
+        if ans.subject.player != turn:
             raise UnsoundMoveError
-        ans.target = self.arrangement[move.to_cell]
+        ans.target = lookup(move.to_cell)
         if ans.target is not None:
-            if ans.target.player == self.turn:
+            if ans.target.player == turn:
                 raise UnsoundMoveError
-        trajectory = move.trajectory()[1:]
-        for c in trajectory:
-            if self.arrangement[c] is not None:
+        for c in move.between():
+            if lookup(c) is not None:
                 raise UnsoundMoveError
         if ans.subject.kind != PieceKind.PAWN:
             return ans
         if move.vector().digest().x:
-            if self.ep_cell() == move.to_cell:
+            if ep_cell == move.to_cell:
                 ans.ep = True
             elif ans.target is None:
                 raise UnsoundMoveError
@@ -60,6 +101,58 @@ class BasePosition:
             if ans.target is not None:
                 raise UnsoundMoveError
         return ans
+
+    @classmethod
+    def _ep_column_after(cls, 
+        move:Move, *,
+        lookup:typing.Callable[[Cell], typing.Optional[Piece]],
+        subject:Piece,
+    ) -> typing.Optional[Column]:
+        if subject.kind != PieceKind.PAWN:
+            return None
+        if abs(move.vector()) != 2:
+            return None
+        walk = consts.vectors.PAWN_WALKS_BY_PLAYER[subject.player]
+        attack_motion = consts.motions.PAWN_ATTACKS_BY_PLAYER[subject.player]
+        for attack in attack_motion:
+            hand = walk + attack
+            try:
+                victimcell = move.from_cell.apply(hand)
+            except ValueError:
+                continue
+            if lookup(victimcell) != subject.invert():
+                continue
+            return move.from_cell.column()
+        return None
+    
+    def _evasions(self, 
+        king:Cell, 
+        checkers:typing.Set[Cell],
+    ) -> typing.Set[Cell]:
+        if len(checkers) != 1:
+            return set()
+        checker, = checkers
+        for motion in (consts.motions.DIAGONAL, consts.motions.FILE):
+            for ray in motion.rays(king):
+                if checker in ray:
+                    return set(ray[:ray.index(checker) + 1])
+        return set(checkers)
+
+    def _legal_moves_by_apply(self) -> typing.Set[Move]:
+        ans = set()
+        for move in self.sound_moves():
+            afterwards = self.apply(move)
+            if not afterwards.is_anticheck():
+                ans.add(move)
+        return ans
+
+    def _moveCharacter(self, move:Move) -> MoveCharacter:
+        return self._characterize(
+            move,
+            lookup=self.arrangement.__getitem__,
+            turn=self.turn,
+            ep_cell=self.ep_cell(),
+        )
                 
     def _pawn_to_cells(self, 
         pawncell:Cell,
@@ -85,6 +178,30 @@ class BasePosition:
                 break
             else:
                 yield advance
+
+    def _pins(self, king:Cell) -> typing.Dict[Cell, typing.Set[Cell]]:
+        ans = dict()
+        finders = (
+            consts.attackerFinders.DIAGONAL,
+            consts.attackerFinders.FILE,
+        )
+        for finder in finders:
+            for ray in finder.motion.rays(king):
+                pinned = None
+                for n, c in enumerate(ray):
+                    p = self.arrangement[c]
+                    if p is None:
+                        continue
+                    if pinned is None:
+                        if p.player != self.turn:
+                            break
+                        pinned = c
+                        continue
+                    if p.player != self.turn:
+                        if p.kind in finder.scaled:
+                            ans[pinned] = set(ray[:n + 1])
+                    break
+        return ans
                     
 
 
@@ -105,7 +222,7 @@ class BasePosition:
         if move.promotion is None:
             arrange[move.to_cell] = moveCharacter.subject
         else:
-            arrange[move.to_cell] = Piece(
+            arrange[move.to_cell] = Piece.by_items(
                 kind=move.promotion,
                 player=self.turn,
             )
@@ -116,21 +233,11 @@ class BasePosition:
         arrangement = self.arrangement.apply(arrange)
 
         # ep_column
-        ep_column = None
-        if moveCharacter.subject.kind == PieceKind.PAWN:
-            if abs(move.vector()) == 2:
-                walk = consts.vectors.PAWN_WALKS_BY_PLAYER[self.turn]
-                attack_motion = consts.motions.PAWN_ATTACKS_BY_PLAYER[self.turn]
-                for attack in attack_motion:
-                    hand = walk + attack
-                    try:
-                        victimcell = move.from_cell.apply(hand)
-                    except ValueError:
-                        continue
-                    if self.arrangement[victimcell] != moveCharacter.subject.invert():
-                        continue
-                    ep_column = move.from_cell.column()
-                    break
+        ep_column = self._ep_column_after(
+            move,
+            lookup=self.arrangement.__getitem__,
+            subject=moveCharacter.subject,
+        )
         
         return cls(
             arrangement=arrangement,
@@ -142,8 +249,48 @@ class BasePosition:
         if self.ep_column is None:
             return None
         return self.ep_column.ep_cell(self.turn)
-    
 
+    @classmethod
+    def from_bytes(cls, data:typing.Union[bytes, memoryview]) -> typing.Self:
+        with memoryview(data).cast('B') as view:
+            if len(view) != SIZE:
+                raise ValueError(data)
+            head = view[0]
+            if head >> 5:
+                raise ValueError(data)
+            try:
+                ep_column = COLUMNS[head & 15]
+                pieces = list(itertools.chain.from_iterable(
+                    map(PAIRS.__getitem__, view[1:])
+                ))
+            except (IndexError, TypeError):
+                raise ValueError(data) from None
+        if pieces.pop() is not None:
+            raise ValueError(data)
+        return cls(
+            arrangement=Arrangement._from_data(tuple(pieces)),
+            ep_column=ep_column,
+            turn=Player(not (head >> 4)),
+        )
+
+    @classmethod
+    def from_notation(cls, notation:str) -> typing.Self:
+        if type(notation) is not str:
+            raise TypeError(notation)
+        try:
+            arrangement, ep_column, turn = notation.split()
+            if ep_column == '-':
+                ep_column = None
+            else:
+                ep_column = Column[ep_column]
+            turn = PLAYERS_BY_SYMBOL[turn]
+        except (KeyError, ValueError):
+            raise ValueError(notation) from None
+        return cls(
+            arrangement=Arrangement.from_notation(arrangement),
+            ep_column=ep_column,
+            turn=turn,
+        )
 
     def is_anticheck(self) -> bool:
         return self.arrangement.is_check(turn=self.turn.invert())
@@ -172,7 +319,11 @@ class BasePosition:
             attack_motion = consts.motions.PAWN_ATTACKS_BY_PLAYER[self.turn]
             further = self.ep_cell().apply(-walk)
             ep_victim = self.arrangement[further]
-            if ep_victim != Piece(kind=PieceKind.PAWN, player=self.turn.invert()):
+            pawn = Piece.by_items(
+                kind=PieceKind.PAWN,
+                player=self.turn.invert(),
+            )
+            if ep_victim != pawn:
                 return False
             ep_attacking_cells = set()
             for attack in attack_motion:
@@ -227,11 +378,37 @@ class BasePosition:
 
 
     def legal_moves(self) -> typing.Set[Move]:
+        kings = self.arrangement.where(
+            Piece.by_items(kind=PieceKind.KING, player=self.turn),
+        )
+        if len(kings) != 1:
+            return self._legal_moves_by_apply()
+        king, = kings
+        opponent = self.turn.invert()
+        checkers = self.arrangement.attackers(king, player=opponent)
+        evasions = self._evasions(king, checkers)
+        pins = self._pins(king)
+        unguarded = BitboardArrangement.from_arrangement(
+            self.arrangement.apply({king:None}),
+        )
+        attacked = unguarded.cells(unguarded.attacked(opponent))
+        ep_cell = self.ep_cell()
         ans = set()
         for move in self.sound_moves():
-            afterwards = self.apply(move)
-            if not afterwards.is_anticheck():
-                ans.add(move)
+            if move.from_cell == king:
+                if move.to_cell not in attacked:
+                    ans.add(move)
+                continue
+            if move.to_cell == ep_cell:
+                if self.arrangement[move.from_cell].kind == PieceKind.PAWN:
+                    if not self.apply(move).is_anticheck():
+                        ans.add(move)
+                    continue
+            if len(checkers) and move.to_cell not in evasions:
+                continue
+            if move.to_cell not in pins.get(move.from_cell, (move.to_cell,)):
+                continue
+            ans.add(move)
         return ans
             
     @classmethod
@@ -242,9 +419,17 @@ class BasePosition:
             turn=Player.WHITE,
         )
     
+    @classmethod
+    def pack(cls, positions:typing.Iterable[typing.Self]) -> bytes:
+        return b"".join(p.to_bytes() for p in positions)
+
     def replace(self, **kwargs) -> typing.Self:
         cls = type(self)
-        dictionary = asdict(self)
+        dictionary = dict(
+            arrangement=self.arrangement,
+            ep_column=self.ep_column,
+            turn=self.turn,
+        )
         dictionary.update(kwargs)
         ans = cls(**dictionary)
         return ans
@@ -259,36 +444,24 @@ class BasePosition:
             if p.kind != PieceKind.PAWN:
                 to_cells = self.arrangement.attacks(c)
                 for to_cell in to_cells:
-                    move = Move(
-                        from_cell=c,
-                        to_cell=to_cell,
-                        promotion=None,
-                    )
+                    move = Move.by_cells(c, to_cell)
                     ans.add(move)
                 continue
             to_cells = self._pawn_to_cells(pawncell=c)
             for to_cell in to_cells:
                 if not to_cell.promotion(self.turn):
-                    move = Move(
-                        from_cell=c,
-                        to_cell=to_cell,
-                        promotion=None,
-                    )
+                    move = Move.by_cells(c, to_cell)
                     ans.add(move)
                     continue
                 for promotion in PieceKind.promotions():
-                    move = Move(
-                        from_cell=c,
-                        to_cell=to_cell,
-                        promotion=promotion,
-                    )
+                    move = Move.by_cells(c, to_cell, promotion)
                     ans.add(move)
         return ans
     
     def termination(self):
-        if len(self.position().legal_moves()):
+        if len(self.legal_moves()):
             return None
-        if self.position().is_check():
+        if self.is_check():
             kind = TerminationKind.CHECKMATE
         else:
             kind = TerminationKind.STALEMATE
@@ -297,6 +470,45 @@ class BasePosition:
             subject=self.turn.invert(),
         )
         return ans
+
+    def to_bytes(self) -> bytes:
+        data = self.arrangement.values()
+        data.append(None)
+        head = COLUMNS.index(self.ep_column)
+        if self.turn == Player.BLACK:
+            head |= 16
+        ans = bytes([head])
+        ans += bytes(
+            (NIBBLES[a] << 4) | NIBBLES[b]
+            for a, b in zip(data[0::2], data[1::2])
+        )
+        return ans
+
+    def to_notation(self) -> str:
+        if self.ep_column is None:
+            ep_column = '-'
+        else:
+            ep_column = self.ep_column.name
+        return ' '.join([
+            self.arrangement.to_notation(),
+            ep_column,
+            TURN_SYMBOLS[self.turn],
+        ])
+
+    @classmethod
+    def unpack(cls, 
+        data:typing.Union[bytes, memoryview],
+    ) -> typing.List[typing.Self]:
+        view = memoryview(data)
+        if len(view) % SIZE:
+            raise ValueError(data)
+        return [
+            cls.from_bytes(view[i:i+SIZE])
+            for i in range(0, len(view), SIZE)
+        ]
+
+    def zobrist(self) -> int:
+        return self._zobrist
     
 
 
@@ -321,9 +533,13 @@ class Position(BasePosition):
                 raise TypeError(ep_column)
         if type(turn) is not Player:
             raise TypeError(turn)
+        zobrist = arrangement.zobrist()
+        zobrist ^= consts.zobrist.EP_COLUMNS[ep_column]
+        zobrist ^= consts.zobrist.TURNS[turn]
         super().__init__(
             arrangement=arrangement,
             ep_column=ep_column,
             turn=turn,
+            _zobrist=zobrist,
         )
 
@@ -0,0 +1,38 @@
+import collections.abc
+import operator
+import typing
+
+__all__ = ['SequenceView']
+
+class SequenceView(collections.abc.Sequence):
+
+    # methods
+    #   dunder
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (str, bytes)):
+            return NotImplemented
+        if not isinstance(other, collections.abc.Sequence):
+            return NotImplemented
+        return tuple(self) == tuple(other)
+    def __getitem__(self, key):
+        if type(key) is slice:
+            return tuple(self[i] for i in range(*key.indices(len(self))))
+        key = operator.index(key)
+        l = len(self)
+        if key < 0:
+            key += l
+        if not (0 <= key < l):
+            raise IndexError(key)
+        return self._getter(key)
+    __hash__ = None
+    def __init__(self, 
+        getter:typing.Callable[[int], typing.Any],
+        length:typing.Callable[[], int],
+    ) -> None:
+        self._getter = getter
+        self._length = length
+    def __len__(self) -> int:
+        return self._length()
+    def __repr__(self) -> str:
+        cls = type(self)
+        return f"{cls.__name__}({list(self)!r})"
@@ -0,0 +1,229 @@
+import mmap
+import os
+import struct
+import typing
+
+from glinski._enums import *
+
+from .pieces import *
+from .positions import *
+
+__all__ = ['Tablebase']
+
+CELLS = tuple(Cell)
+INDICES = {cell:i for i, cell in enumerate(CELLS)}
+HFLIPS = tuple(INDICES[cell.hflip()] for cell in CELLS)
+VFLIPS = tuple(INDICES[cell.vflip()] for cell in CELLS)
+CELL_RANGE = range(len(CELLS))
+CELL_MAPS = (CELL_RANGE, VFLIPS)
+COLUMN_VALUES = tuple(cell.column().value for cell in CELLS)
+MIDDLE = Column.f.value
+KING_CELLS = tuple(i for i in range(len(CELLS)) if COLUMN_VALUES[i] <= MIDDLE)
+KING_SLOTS = {cell:i for i, cell in enumerate(KING_CELLS)}
+TURNS = {Player.WHITE:0, Player.BLACK:1}
+MAGIC = b'GLTB'
+HEADER = struct.Struct('<4s16s')
+ENTRY = 2
+PLY_BITS = 13
+PLY_MASK = (1 << PLY_BITS) - 1
+INVALID = 0
+LOSS = 1
+STALEMATE_LOSS = 2
+DRAW = 3
+STALEMATE_WIN = 4
+WIN = 5
+OUTCOMES_BY_TURN = {
+    Player.WHITE:(None,) + tuple(Outcome),
+    Player.BLACK:(None,) + tuple(Outcome)[::-1],
+}
+MATERIAL_BITS = {
+    Piece.by_items(kind=kind, player=player):1 << 4 * i
+    for i, (kind, player) in enumerate(
+        (k, p) for p in Player for k in PieceKind
+    )
+}
+MATERIAL = typing.Tuple[Piece, ...]
+
+def _rank(piece:Piece) -> typing.Tuple[int, int]:
+    return TURNS[piece.player], -piece.kind.value
+
+def _strength(material:MATERIAL, player:Player) -> typing.Tuple[int, ...]:
+    kinds = sorted(
+        (p.kind.value for p in material if p.player == player),
+        reverse=True,
+    )
+    return (len(kinds),) + tuple(kinds)
+
+def _canonical(pieces:typing.Iterable[Piece]) -> MATERIAL:
+    material = tuple(pieces)
+    for piece in material:
+        if type(piece) is not Piece:
+            raise TypeError(piece)
+        if piece.kind == PieceKind.PAWN:
+            raise ValueError(material)
+    for player in Player:
+        king = Piece.by_items(kind=PieceKind.KING, player=player)
+        if material.count(king) != 1:
+            raise ValueError(material)
+    white = _strength(material, Player.WHITE)
+    black = _strength(material, Player.BLACK)
+    if white < black:
+        material = tuple(p.invert() for p in material)
+    return tuple(sorted(material, key=_rank))
+
+def _from_notation(notation:str) -> MATERIAL:
+    if type(notation) is not str:
+        raise TypeError(notation)
+    return _canonical(Piece.from_symbol(char) for char in notation)
+
+def _notation(material:MATERIAL) -> str:
+    return ''.join(p.symbol() for p in material)
+
+def _material_key(material:MATERIAL) -> int:
+    return sum(MATERIAL_BITS[p] for p in material)
+
+def _firsts(material:MATERIAL) -> typing.Dict[Piece, int]:
+    ans = dict()
+    for i, piece in enumerate(material):
+        ans.setdefault(piece, i)
+    return ans
+
+def _size(material:MATERIAL) -> int:
+    return 2 * len(KING_CELLS) * len(CELLS) ** (len(material) - 1)
+
+def _raw_index(cells:typing.Sequence[int], turn:int) -> int:
+    ans = turn * len(KING_CELLS) + KING_SLOTS[cells[0]]
+    for i in range(1, len(cells)):
+        ans = ans * len(CELLS) + cells[i]
+    return ans
+
+def _index(cells:typing.Sequence[int], turn:int) -> int:
+    column = COLUMN_VALUES[cells[0]]
+    if column < MIDDLE:
+        return _raw_index(cells, turn)
+    flipped = _raw_index([HFLIPS[c] for c in cells], turn)
+    if column > MIDDLE:
+        return flipped
+    return min(flipped, _raw_index(cells, turn))
+
+def _cells(index:int, count:int) -> typing.List[int]:
+    ans = [0] * count
+    for i in range(count - 1, 0, -1):
+        index, ans[i] = divmod(index, len(CELLS))
+    ans[0] = KING_CELLS[index % len(KING_CELLS)]
+    return ans
+
+class Tablebase:
+
+    # methods
+    #   dunder
+    def __enter__(self) -> typing.Self:
+        return self
+    def __exit__(self, *args) -> None:
+        self.close()
+    def __init__(self, path:typing.Union[str, os.PathLike]) -> None:
+        self._file = open(path, 'rb')
+        try:
+            self._data = mmap.mmap(
+                self._file.fileno(),
+                0,
+                access=mmap.ACCESS_READ,
+            )
+        except ValueError:
+            self._file.close()
+            raise
+        try:
+            magic, notation = HEADER.unpack_from(self._data)
+            if magic != MAGIC:
+                raise ValueError(path)
+            self._material = _from_notation(notation.rstrip(b'\0').decode())
+            if len(self._data) != HEADER.size + ENTRY * _size(self._material):
+                raise ValueError(path)
+        except (ValueError, struct.error):
+            self.close()
+            raise ValueError(path) from None
+        inverse = tuple(p.invert() for p in self._material)
+        self._keys = (_material_key(self._material), _material_key(inverse))
+        self._firsts = (_firsts(self._material), _firsts(inverse))
+        self._weights = tuple(
+            len(CELLS) ** (len(self._material) - 1 - i)
+            for i in range(len(self._material))
+        )
+        self._seen = [0] * len(self._material)
+    def __len__(self) -> int:
+        return _size(self._material)
+
+    #   protected
+    def _entry(self, position:Position) -> int:
+        if type(position) is not Position:
+            raise TypeError(position)
+        offset = self._offset(
+            position.arrangement._data,
+            CELL_RANGE,
+            TURNS[position.turn],
+        )
+        return self._data[offset] | self._data[offset + 1] << 8
+
+    def _offset(self,
+        pieces:typing.Sequence[typing.Optional[Piece]],
+        cells:typing.Sequence[int],
+        turn:int,
+    ) -> int:
+        key = 0
+        for piece in pieces:
+            if piece is not None:
+                key += MATERIAL_BITS[piece]
+        if key == self._keys[0]:
+            side = 0
+        elif key == self._keys[1]:
+            side = 1
+            turn = 1 - turn
+        else:
+            raise ValueError(key)
+        firsts = self._firsts[side]
+        cell_map = CELL_MAPS[side]
+        weights = self._weights
+        seen = self._seen
+        for i in range(len(seen)):
+            seen[i] = 0
+        king = direct = flipped = 0
+        for i in range(len(cells)):
+            piece = pieces[i]
+            if piece is None:
+                continue
+            first = firsts[piece]
+            slot = first + seen[first]
+            seen[first] += 1
+            cell = cell_map[cells[i]]
+            if slot:
+                direct += cell * weights[slot]
+                flipped += HFLIPS[cell] * weights[slot]
+            else:
+                king = cell
+        base = turn * len(KING_CELLS)
+        column = COLUMN_VALUES[king]
+        index = None
+        if column <= MIDDLE:
+            index = (base + KING_SLOTS[king]) * weights[0] + direct
+        if column >= MIDDLE:
+            king = HFLIPS[king]
+            other = (base + KING_SLOTS[king]) * weights[0] + flipped
+            if index is None or other < index:
+                index = other
+        return HEADER.size + ENTRY * index
+
+    #   public
+    def close(self) -> None:
+        if not self._data.closed:
+            self._data.close()
+        self._file.close()
+
+    def distance(self, position:Position) -> int:
+        return self._entry(position) & PLY_MASK
+
+    def material(self) -> str:
+        return _notation(self._material)
+
+    def outcome(self, position:Position) -> typing.Optional[Outcome]:
+        code = self._entry(position) >> PLY_BITS
+        return OUTCOMES_BY_TURN[position.turn][code]
@@ -4,13 +4,14 @@ from glinski._enums import *
 
 __all__ = ['Termination']
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BaseTermination:
     kind:TerminationKind
     subject:Player
     outcome:Outcome
 
 class Termination(BaseTermination):
+    __slots__ = ()
     def __init__(self, *, 
         kind:TerminationKind,
         subject:Player,
@@ -0,0 +1,112 @@
+import struct
+import typing
+
+from glinski._enums import *
+
+from .moves import *
+
+__all__ = ['TranspositionTable']
+
+ENTRY = struct.Struct('<QbBiH')
+BUCKET = 2 * ENTRY.size
+BOUND_OFFSET = struct.calcsize('<Qb')
+NO_MOVE = 0xFFFF
+MAX_DEPTH = 127
+MIN_DEPTH = -128
+BOUNDS = (None,) + tuple(Bound)
+BOUND_INDICES = {bound:i for i, bound in enumerate(BOUNDS)}
+PROBE = typing.Tuple[int, Bound, int, typing.Optional[Move]]
+
+class TranspositionTable:
+
+    # methods
+    #   dunder
+    def __init__(self, mb:int=16) -> None:
+        if type(mb) is not int:
+            raise TypeError(mb)
+        if mb < 1:
+            raise ValueError(mb)
+        self._buckets = (mb << 20) // BUCKET
+        self._data = bytearray(self._buckets * BUCKET)
+        self._hits = 0
+        self._misses = 0
+        self._collisions = 0
+        self._stores = 0
+    def __len__(self) -> int:
+        return self._buckets * 2
+
+    #   protected
+    def _offset(self, key:int) -> int:
+        return (key % self._buckets) * BUCKET
+
+    #   public
+    def clear(self) -> None:
+        self._data[:] = bytes(len(self._data))
+        self._hits = 0
+        self._misses = 0
+        self._collisions = 0
+        self._stores = 0
+
+    def probe(self, key:int) -> typing.Optional[PROBE]:
+        offset = self._offset(key)
+        collision = False
+        for slot in (offset, offset + ENTRY.size):
+            k, depth, bound, score, code = ENTRY.unpack_from(self._data, slot)
+            if not bound:
+                continue
+            if k != key:
+                collision = True
+                continue
+            self._hits += 1
+            move = None if code == NO_MOVE else Move.from_code(code)
+            return depth, BOUNDS[bound], score, move
+        self._misses += 1
+        if collision:
+            self._collisions += 1
+        return None
+
+    def stats(self) -> typing.Dict[str, int]:
+        return dict(
+            hits=self._hits,
+            misses=self._misses,
+            collisions=self._collisions,
+            stores=self._stores,
+            used=self.used(),
+            size=len(self),
+        )
+
+    def store(self, key:int, *,
+        depth:int,
+        bound:Bound,
+        score:int,
+        move:typing.Optional[Move]=None,
+    ) -> None:
+        if type(bound) is not Bound:
+            raise TypeError(bound)
+        depth = max(MIN_DEPTH, min(MAX_DEPTH, depth))
+        code = NO_MOVE if move is None else move.code()
+        offset = self._offset(key)
+        k, d, b, s, c = ENTRY.unpack_from(self._data, offset)
+        other = ENTRY.unpack_from(self._data, offset + ENTRY.size)
+        if other[2] and other[0] == key:
+            offset += ENTRY.size
+            k, d, b, s, c = other
+        elif b and k != key and depth < d:
+            offset += ENTRY.size
+            k, d, b, s, c = other
+        if b and k == key and move is None:
+            code = c
+        ENTRY.pack_into(
+            self._data,
+            offset,
+            key,
+            depth,
+            BOUND_INDICES[bound],
+            score,
+            code,
+        )
+        self._stores += 1
+
+    def used(self) -> int:
+        bounds = self._data[BOUND_OFFSET::ENTRY.size]
+        return len(bounds) - bounds.count(0)
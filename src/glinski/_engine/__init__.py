@@ -0,0 +1,462 @@
+import argparse
+import time
+import typing
+from dataclasses import dataclass
+
+from glinski._consts import *
+from glinski._dataholders import *
+from glinski._enums import *
+
+__all__ = [
+    'evaluate',
+    'search',
+    'SearchResult',
+    'static_exchange',
+]
+
+INFINITY = consts.values.MATE + 1
+CHECK_INTERVAL = 1024
+MAX_PLY = 1000
+TABLE = None
+EXCHANGE_RAYS = typing.Tuple[
+    typing.Tuple[typing.Tuple[int, typing.FrozenSet[Piece]], ...],
+    ...
+]
+
+def _pieces(
+    kinds:typing.Iterable[PieceKind], 
+    *players:Player,
+) -> typing.FrozenSet[Piece]:
+    return frozenset(
+        Piece.by_items(kind=kind, player=player)
+        for kind in kinds
+        for player in players
+    )
+
+def _exchange_rays(target:Cell) -> EXCHANGE_RAYS:
+    pawns = {
+        player:{
+            direction[0][0]
+            for direction in consts.attackerFinders.PAWN_ATTACKS_BY_PLAYER[
+                player
+            ].directions(target)
+        }
+        for player in Player
+    }
+    ans = list()
+    for finder in (consts.attackerFinders.DIAGONAL, consts.attackerFinders.FILE):
+        for ray in finder.motion.rays(target):
+            entries = list()
+            for n, cell in enumerate(ray):
+                if n:
+                    pieces = _pieces(finder.scaled, *Player)
+                else:
+                    pieces = _pieces(finder.scaled | finder.unscaled, *Player)
+                for player in Player:
+                    if cell in pawns[player]:
+                        pieces |= _pieces([PieceKind.PAWN], player)
+                        pawns[player].remove(cell)
+                entries.append((cell.index(), pieces))
+            ans.append(tuple(entries))
+    for player in Player:
+        for cell in pawns[player]:
+            ans.append((
+                (cell.index(), _pieces([PieceKind.PAWN], player)),
+            ))
+    for ray in consts.motions.HORSE.rays(target):
+        if ray:
+            ans.append((
+                (ray[0].index(), _pieces([PieceKind.KNIGHT], *Player)),
+            ))
+    return tuple(ans)
+
+EXCHANGE_RAYS_BY_CELL = {cell:_exchange_rays(cell) for cell in Cell}
+
+@dataclass(frozen=True)
+class SearchResult:
+    move:typing.Optional[Move]
+    score:int
+    pv:typing.Tuple[Move, ...]
+    depth:int
+    nodes:int
+    seconds:float
+    def nps(self) -> float:
+        if not self.seconds:
+            return 0.0
+        return self.nodes / self.seconds
+
+class _Timeout(Exception):
+    pass
+
+class _Search:
+
+    # methods
+    #   dunder
+    def __init__(self, *,
+        seconds:typing.Optional[float],
+        nodes:typing.Optional[int],
+        table:TranspositionTable,
+    ) -> None:
+        self._table = table
+        self._start = time.perf_counter()
+        if seconds is None:
+            self._deadline = None
+        else:
+            self._deadline = self._start + seconds
+        self._limit = nodes
+        self._nodes = 0
+        self._pv = ()
+
+    #   protected
+    def _count(self) -> None:
+        self._nodes += 1
+        if self._limit is not None and self._nodes > self._limit:
+            raise _Timeout
+        if self._deadline is None or self._nodes % CHECK_INTERVAL:
+            return
+        if time.perf_counter() >= self._deadline:
+            raise _Timeout
+
+    def _negamax(self,
+        position:Position,
+        depth:int,
+        alpha:int,
+        beta:int,
+        ply:int,
+    ) -> typing.Tuple[int, typing.Tuple[Move, ...]]:
+        if depth <= 0:
+            return self._quiescence(position, alpha, beta), ()
+        self._count()
+        key = position.zobrist()
+        entry = self._table.probe(key)
+        hashed = None
+        if entry is not None:
+            stored, bound, score, hashed = entry
+            score = _from_table(score, ply)
+            if ply and stored >= depth:
+                line = () if hashed is None else (hashed,)
+                if bound != Bound.UPPER and score >= beta:
+                    return score, line
+                if bound != Bound.LOWER and score <= alpha:
+                    return score, line
+        moves = position.legal_moves()
+        if not moves:
+            if position.is_check():
+                return ply - consts.values.MATE, ()
+            return -consts.values.STALEMATE, ()
+        if ply < len(self._pv):
+            previous = self._pv[ply]
+        else:
+            previous = None
+        start = alpha
+        pv = ()
+        for move in self._order(position, moves, hashed, previous):
+            score, line = self._negamax(
+                position.apply(move),
+                depth - 1,
+                -beta,
+                -alpha,
+                ply + 1,
+            )
+            score = -score
+            if score >= beta:
+                self._table.store(
+                    key,
+                    depth=depth,
+                    bound=Bound.LOWER,
+                    score=_to_table(score, ply),
+                    move=move,
+                )
+                return score, (move,) + line
+            if score > alpha:
+                alpha = score
+                pv = (move,) + line
+        self._table.store(
+            key,
+            depth=depth,
+            bound=Bound.EXACT if alpha > start else Bound.UPPER,
+            score=_to_table(alpha, ply),
+            move=pv[0] if pv else None,
+        )
+        return alpha, pv
+
+    def _order(self,
+        position:Position,
+        moves:typing.Iterable[Move],
+        *firsts:typing.Optional[Move],
+    ) -> typing.List[Move]:
+        def key(move:Move) -> typing.Tuple[int, int, int, str]:
+            if move in firsts:
+                return (0, firsts.index(move), 0, '')
+            victim = _victim(position, move)
+            if victim is None:
+                return (2, 0, 0, str(move))
+            attacker = position.arrangement[move.from_cell].kind
+            return (
+                1,
+                -consts.values.PIECES[victim],
+                consts.values.PIECES[attacker],
+                str(move),
+            )
+        return sorted(moves, key=key)
+
+    def _quiescence(self, position:Position, alpha:int, beta:int) -> int:
+        self._count()
+        stand = evaluate(position)
+        if stand >= beta:
+            return stand
+        alpha = max(alpha, stand)
+        captures = [
+            m for m in position.legal_moves()
+            if _victim(position, m) is not None
+            and static_exchange(position, m) >= 0
+        ]
+        for move in self._order(position, captures):
+            score = -self._quiescence(position.apply(move), -beta, -alpha)
+            if score >= beta:
+                return score
+            alpha = max(alpha, score)
+        return alpha
+
+    #   public
+    def run(self,
+        position:Position, *,
+        depth:typing.Optional[int],
+    ) -> SearchResult:
+        moves = position.legal_moves()
+        result = SearchResult(
+            move=min(moves, key=str) if moves else None,
+            score=0,
+            pv=(),
+            depth=0,
+            nodes=0,
+            seconds=0.0,
+        )
+        if not moves:
+            return result
+        current = 1
+        while depth is None or current <= depth:
+            try:
+                score, pv = self._negamax(
+                    position,
+                    current,
+                    -INFINITY,
+                    INFINITY,
+                    0,
+                )
+            except _Timeout:
+                break
+            self._pv = pv
+            result = SearchResult(
+                move=pv[0] if pv else result.move,
+                score=score,
+                pv=pv,
+                depth=current,
+                nodes=self._nodes,
+                seconds=time.perf_counter() - self._start,
+            )
+            if abs(score) >= consts.values.MATE - current:
+                break
+            current += 1
+        return SearchResult(
+            move=result.move,
+            score=result.score,
+            pv=result.pv,
+            depth=result.depth,
+            nodes=self._nodes,
+            seconds=time.perf_counter() - self._start,
+        )
+
+def _from_table(score:int, ply:int) -> int:
+    if score >= consts.values.MATE - MAX_PLY:
+        return score - ply
+    if score <= MAX_PLY - consts.values.MATE:
+        return score + ply
+    return score
+
+def _to_table(score:int, ply:int) -> int:
+    if score >= consts.values.MATE - MAX_PLY:
+        return score + ply
+    if score <= MAX_PLY - consts.values.MATE:
+        return score - ply
+    return score
+
+def _victim(position:Position, move:Move) -> typing.Optional[PieceKind]:
+    piece = position.arrangement[move.to_cell]
+    if piece is not None:
+        return piece.kind
+    if move.to_cell != position.ep_cell():
+        return None
+    if position.arrangement[move.from_cell].kind != PieceKind.PAWN:
+        return None
+    return PieceKind.PAWN
+
+def _rank(piece:Piece) -> typing.Tuple[bool, int]:
+    return piece.kind == PieceKind.KING, consts.values.PIECES[piece.kind]
+
+def static_exchange(position:Position, move:Move) -> int:
+    if type(position) is not Position:
+        raise TypeError(position)
+    if type(move) is not Move:
+        raise TypeError(move)
+    arrangement = position.arrangement
+    subject = arrangement[move.from_cell]
+    if subject is None:
+        raise UnsoundMoveError(move)
+    values = consts.values.PIECES
+    removed = {move.from_cell.index()}
+    victim = _victim(position, move)
+    gains = [0 if victim is None else values[victim]]
+    if victim is not None and arrangement[move.to_cell] is None:
+        walk = consts.vectors.PAWN_WALKS_BY_PLAYER[position.turn]
+        removed.add(move.to_cell.apply(-walk).index())
+    if move.promotion is None:
+        occupant = values[subject.kind]
+    else:
+        occupant = values[move.promotion]
+        gains[0] += occupant - values[PieceKind.PAWN]
+    queues = list()
+    for ray in EXCHANGE_RAYS_BY_CELL[move.to_cell]:
+        queue = list()
+        for index, pieces in ray:
+            if index in removed:
+                continue
+            piece = arrangement.at(index)
+            if piece is None:
+                continue
+            if piece not in pieces:
+                break
+            queue.append(piece)
+        if queue:
+            queue.reverse()
+            queues.append(queue)
+    side = position.turn.invert()
+    promoting = move.to_cell.promotion()
+    while True:
+        best = None
+        for queue in queues:
+            if queue[-1].player != side:
+                continue
+            if best is None or _rank(queue[-1]) < _rank(best[-1]):
+                best = queue
+        if best is None:
+            break
+        attacker = best.pop()
+        if attacker.kind == PieceKind.KING:
+            if any(q and q[-1].player != side for q in queues):
+                break
+        queues = [q for q in queues if q]
+        gains.append(occupant - gains[-1])
+        occupant = values[attacker.kind]
+        if attacker.kind == PieceKind.PAWN and promoting == side:
+            gains[-1] += values[PieceKind.QUEEN] - values[PieceKind.PAWN]
+            occupant = values[PieceKind.QUEEN]
+        side = side.invert()
+    for i in range(len(gains) - 1, 0, -1):
+        gains[i - 1] = -max(-gains[i - 1], gains[i])
+    return gains[0]
+
+def _table() -> TranspositionTable:
+    global TABLE
+    if TABLE is None:
+        TABLE = TranspositionTable()
+    return TABLE
+
+def evaluate(position:Position) -> int:
+    ans = position.arrangement.score()
+    if position.turn == Player.BLACK:
+        ans = -ans
+    return ans
+
+def search(
+    position:Position, *,
+    depth:typing.Optional[int]=None,
+    seconds:typing.Optional[float]=None,
+    nodes:typing.Optional[int]=None,
+    table:typing.Optional[TranspositionTable]=None,
+) -> SearchResult:
+    if type(position) is not Position:
+        raise TypeError(position)
+    if depth is None and seconds is None and nodes is None:
+        raise ValueError("a depth, time or node limit is required")
+    if depth is not None:
+        if type(depth) is not int:
+            raise TypeError(depth)
+        if depth < 1:
+            raise ValueError(depth)
+    if seconds is not None:
+        seconds = float(seconds)
+        if seconds <= 0:
+            raise ValueError(seconds)
+    if nodes is not None:
+        if type(nodes) is not int:
+            raise TypeError(nodes)
+        if nodes < 1:
+            raise ValueError(nodes)
+    if table is None:
+        table = _table()
+        table.clear()
+    if type(table) is not TranspositionTable:
+        raise TypeError(table)
+    searcher = _Search(seconds=seconds, nodes=nodes, table=table)
+    return searcher.run(position, depth=depth)
+
+def main(args:typing.Optional[typing.List[str]]=None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m glinski.engine",
+        description="Search a position for the best move.",
+    )
+    parser.add_argument(
+        'notation',
+        nargs='?',
+        default=None,
+        help="position in text notation, the native position by default",
+    )
+    parser.add_argument(
+        '--depth',
+        type=int,
+        default=None,
+        help="maximal depth in plies",
+    )
+    parser.add_argument(
+        '--seconds',
+        type=float,
+        default=None,
+        help="time budget",
+    )
+    parser.add_argument(
+        '--nodes',
+        type=int,
+        default=None,
+        help="node budget",
+    )
+    parser.add_argument(
+        '--hash',
+        type=int,
+        default=16,
+        help="transposition table size in MB",
+    )
+    ns = parser.parse_args(args)
+    if ns.notation is None:
+        position = Position.native()
+    else:
+        position = Position.from_notation(ns.notation)
+    if ns.depth is None and ns.seconds is None and ns.nodes is None:
+        ns.depth = 3
+    table = TranspositionTable(ns.hash)
+    result = search(
+        position,
+        depth=ns.depth,
+        seconds=ns.seconds,
+        nodes=ns.nodes,
+        table=table,
+    )
+    print(f"bestmove: {result.move}")
+    print(f"score: {result.score}")
+    print(f"pv: {' '.join(str(m) for m in result.pv)}")
+    print(f"depth: {result.depth}")
+    print(f"nodes: {result.nodes}")
+    print(f"seconds: {result.seconds:.3f}")
+    print(f"nodes/second: {result.nps():.0f}")
+    for k, v in table.stats().items():
+        print(f"table {k}: {v}")
@@ -1,6 +1,6 @@
+from .bounds import *
 from .cells import *
 from .colors import *
-from .comments import *
 from .pieces import *
 from .players import *
 from .terminations import *
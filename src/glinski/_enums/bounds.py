@@ -0,0 +1,8 @@
+from enum import Enum
+
+__all__ = ['Bound']
+
+class Bound(Enum):
+    EXACT = 1
+    LOWER = 2
+    UPPER = 3
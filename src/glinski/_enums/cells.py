@@ -22,6 +22,13 @@ __all__ = [
 # global variables
 NATIVES = dict()
 CELLS = None
+INDICES = None
+COLORS = None
+COLUMNS = None
+NATIVES_BY_INDEX = None
+PAWN_LEGAL_BY_PLAYER = None
+PROMOTIONS = None
+ROWS = None
 
 
 
@@ -86,14 +93,17 @@ class BaseCell:
         cls = type(self)
         ans = cls(self.value + vector)
         return ans
+    @classmethod
+    def by_index(cls, value:int, /) -> typing.Self:
+        if type(value) is not int:
+            raise TypeError(value)
+        if value < 0:
+            raise IndexError(value)
+        return CELLS[value]
     def color(self) -> Color:
-        desc = self.value.description()
-        residue = (sum(desc) + 1) % 3
-        value = residue / 2
-        ans = Color(value)
-        return ans
+        return COLORS[INDICES[self]]
     def column(self) -> Column:
-        return Column[self.name[0]]
+        return COLUMNS[INDICES[self]]
     def count_up(self, *, 
         vector:Vector,
         start:int=0,
@@ -117,28 +127,25 @@ class BaseCell:
     def hflip(self) -> typing.Self:
         cls = type(self)
         return cls(self.value.hflip())
+    def index(self) -> int:
+        return INDICES[self]
     def native(self) -> typing.Union[Piece, None]:
-        return NATIVES.get(self)
+        return NATIVES_BY_INDEX[INDICES[self]]
     def pawn_legal(self, player:Player) -> bool:
         if type(player) is not Player:
             raise TypeError(player)
-        if self.promotion(player):
-            return False
-        if player == Player.WHITE:
-            return self.row() >= self.column().height() - 6 
-        else:
-            return self.row() <= 7
+        return PAWN_LEGAL_BY_PLAYER[player][INDICES[self]]
     def promotion(self, 
         player:typing.Optional[Player]=None,
     ) -> typing.Union[bool, typing.Optional[Player]]:
-        if player is not None:
-            return self == self.column().promotion(player)
-        for player in Player:
-            if self == self.column().promotion(player):
-                return player
-        return None
+        ans = PROMOTIONS[INDICES[self]]
+        if player is None:
+            return ans
+        if type(player) is not Player:
+            raise TypeError(player)
+        return ans == player
     def row(self) -> int:
-        return int(self.name[1:])
+        return ROWS[INDICES[self]]
     def vector_from(self, other:typing.Self) -> Vector:
         return -self.vector_to(other)
     def vector_to(self, other:typing.Self) -> Vector:
@@ -164,6 +171,7 @@ Cell = Enum('Cell', celldict(), type=BaseCell)
 
 # CELLS
 CELLS = tuple(Cell)
+INDICES = {cell:i for i, cell in enumerate(CELLS)}
 
 # NATIVES
 def blacknatives() -> typing.Dict[str, str]:
@@ -201,3 +209,28 @@ for K, V in NATIVES.items():
         raise TypeError
 
 
+# per-cell tables
+def promotion(cell:Cell) -> typing.Optional[Player]:
+    for player in Player:
+        if cell == cell.column().promotion(player):
+            return player
+    return None
+def pawn_legal(cell:Cell, player:Player) -> bool:
+    if cell.promotion(player):
+        return False
+    if player == Player.WHITE:
+        return cell.row() >= cell.column().height() - 6
+    else:
+        return cell.row() <= 7
+ROWS = tuple(int(cell.name[1:]) for cell in CELLS)
+COLUMNS = tuple(Column[cell.name[0]] for cell in CELLS)
+COLORS = tuple(
+    Color(((sum(cell.value.description()) + 1) % 3) / 2)
+    for cell in CELLS
+)
+PROMOTIONS = tuple(promotion(cell) for cell in CELLS)
+PAWN_LEGAL_BY_PLAYER = {
+    player:tuple(pawn_legal(cell, player) for cell in CELLS)
+    for player in Player
+}
+NATIVES_BY_INDEX = tuple(NATIVES.get(cell) for cell in CELLS)
@@ -11,7 +11,7 @@ class TerminationKind(Enum):
     SEVENTYFIVE_MOVES = 4
     FIVEFOLD_REPETITION = 5
 
-    def for_subject(self) -> typing.:
+    def for_subject(self) -> typing.Optional[float]:
         cls = type(self)
         ans = {
             cls.CHECKMATE:1.00,
@@ -0,0 +1,188 @@
+import argparse
+import os
+import time
+import typing
+from concurrent.futures import ProcessPoolExecutor
+
+from glinski._dataholders import *
+from glinski._enums import *
+
+__all__ = [
+    'perft',
+    'perft_divide',
+    'REFERENCES',
+]
+
+REFERENCES = {
+    'native':dict(
+        pieces=None,
+        moves="",
+        turn=Player.WHITE,
+        counts=(1, 51, 2586, 137858, 7282418),
+    ),
+    'en_passant':dict(
+        pieces=None,
+        moves="d1g2 g7g6 g2d1 f11g9 d1f4 d7d5 e4e6",
+        turn=Player.WHITE,
+        counts=(1, 61, 3240, 196348, 10887712),
+    ),
+    'pins':dict(
+        pieces="Kf6 Nf8 Be7 Rg6 Pe5 Pd3 Qb1 rf10 qd8 rk6 bc3 ka6 ph7 nh5",
+        moves="",
+        turn=Player.WHITE,
+        counts=(1, 30, 1700, 56123, 3357435),
+    ),
+    'promotion':dict(
+        pieces="Kb1 Pe9 Pc7 Pg8 Ni4 kk7 rd9 nf10 ph2 pb3 bc1",
+        moves="",
+        turn=Player.WHITE,
+        counts=(1, 27, 966, 25629, 926590),
+    ),
+}
+
+def _reference(name:str) -> Position:
+    info = REFERENCES[name]
+    if info['pieces'] is None:
+        ans = Position.native()
+    else:
+        dictionary = dict()
+        for token in info['pieces'].split():
+            dictionary[Cell[token[1:]]] = Piece.from_symbol(token[0])
+        ans = Position(
+            arrangement=Arrangement(dictionary),
+            turn=info['turn'],
+        )
+    for move in info['moves'].split():
+        ans = ans.apply(Move.from_uci(move))
+    return ans
+
+def _check(position:Position, depth:int, workers:typing.Optional[int]) -> int:
+    if type(position) is not Position:
+        raise TypeError(position)
+    if type(depth) is not int:
+        raise TypeError(depth)
+    if depth < 0:
+        raise ValueError(depth)
+    if workers is None:
+        return os.cpu_count() or 1
+    if type(workers) is not int:
+        raise TypeError(workers)
+    if workers < 1:
+        raise ValueError(workers)
+    return workers
+
+def _count(position:Position, depth:int) -> int:
+    if depth == 0:
+        return 1
+    moves = position.legal_moves()
+    if depth == 1:
+        return len(moves)
+    ans = 0
+    for move in moves:
+        ans += _count(position.apply(move), depth - 1)
+    return ans
+
+def _count_bytes(data:bytes, depth:int) -> int:
+    return _count(Position.from_bytes(data), depth)
+
+def _divide(
+    position:Position, 
+    depth:int, 
+    workers:int,
+) -> typing.Dict[Move, int]:
+    moves = sorted(position.legal_moves(), key=str)
+    keys = list()
+    tasks = list()
+    for move in moves:
+        child = position.apply(move)
+        if depth < 3:
+            keys.append(move)
+            tasks.append(child.to_bytes())
+            continue
+        for reply in sorted(child.legal_moves(), key=str):
+            keys.append(move)
+            tasks.append(child.apply(reply).to_bytes())
+    remaining = depth - 1 if depth < 3 else depth - 2
+    chunksize = max(1, len(tasks) // (workers * 8))
+    ans = dict.fromkeys(moves, 0)
+    with ProcessPoolExecutor(workers) as executor:
+        counts = executor.map(
+            _count_bytes,
+            tasks,
+            [remaining] * len(tasks),
+            chunksize=chunksize,
+        )
+        for move, count in zip(keys, counts):
+            ans[move] += count
+    return ans
+
+def perft(
+    position:Position, 
+    depth:int, *,
+    workers:typing.Optional[int]=1,
+) -> int:
+    workers = _check(position, depth, workers)
+    if workers == 1 or depth < 2:
+        return _count(position, depth)
+    return sum(_divide(position, depth, workers).values())
+
+def perft_divide(
+    position:Position, 
+    depth:int, *,
+    workers:typing.Optional[int]=1,
+) -> typing.Dict[Move, int]:
+    workers = _check(position, depth, workers)
+    if depth < 1:
+        raise ValueError(depth)
+    if workers != 1:
+        return _divide(position, depth, workers)
+    ans = dict()
+    for move in sorted(position.legal_moves(), key=str):
+        ans[move] = _count(position.apply(move), depth - 1)
+    return ans
+
+def main(args:typing.Optional[typing.List[str]]=None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m glinski.perft",
+        description="Count the leaf nodes of the legal move tree.",
+    )
+    parser.add_argument(
+        'depth',
+        type=int,
+        help="depth of the move tree",
+    )
+    parser.add_argument(
+        '--position',
+        choices=sorted(REFERENCES.keys()),
+        default='native',
+        help="reference position to start from",
+    )
+    parser.add_argument(
+        '--divide',
+        action='store_true',
+        help="print the count below every root move",
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help="number of worker processes",
+    )
+    ns = parser.parse_args(args)
+    position = _reference(ns.position)
+    start = time.perf_counter()
+    if ns.divide:
+        counts = perft_divide(position, ns.depth, workers=ns.workers)
+        for move, count in counts.items():
+            print(f"{move}: {count}")
+        nodes = sum(counts.values())
+    else:
+        nodes = perft(position, ns.depth, workers=ns.workers)
+    seconds = time.perf_counter() - start
+    print(f"nodes: {nodes}")
+    print(f"seconds: {seconds:.3f}")
+    print(f"nodes/second: {nodes / seconds if seconds else 0.0:.0f}")
+    expected = REFERENCES[ns.position]['counts']
+    if ns.depth < len(expected):
+        if expected[ns.depth] != nodes:
+            parser.exit(1, f"expected {expected[ns.depth]} nodes\n")
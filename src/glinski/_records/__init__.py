@@ -0,0 +1,218 @@
+import contextlib
+import functools
+import os
+import re
+import typing
+from array import array
+
+from glinski._dataholders import *
+from glinski._enums import *
+
+__all__ = ['GameWriter', 'read_games']
+
+NATIVE_POSITION = Position.native()
+NATIVE_NOTATION = NATIVE_POSITION.to_notation()
+TOKENS_BY_RESULT = {
+    Outcome.FULL_WIN_FOR_WHITE:'1-0',
+    Outcome.FULL_WIN_FOR_BLACK:'0-1',
+    Outcome.DRAW:'1/2-1/2',
+    Outcome.HALF_WIN_FOR_WHITE:'3/4-1/4',
+    Outcome.HALF_WIN_FOR_BLACK:'1/4-3/4',
+    None:'*',
+}
+RESULTS_BY_TOKEN = {v:k for k, v in TOKENS_BY_RESULT.items()}
+HEADER = re.compile(r'\[(\w+)\s+"((?:[^"\\]|\\.)*)"\]')
+ESCAPE = re.compile(r'\\(.)')
+BUFFER = 1 << 16
+WIDTH = 80
+ROOTS = 1024
+CODES_BY_TOKEN = dict()
+TOKENS_BY_CODE = dict()
+SOURCE = typing.Union[str, os.PathLike, typing.TextIO]
+ITEM = typing.Union[Game, GameRecord]
+
+@contextlib.contextmanager
+def _opened(
+    source:SOURCE,
+    mode:str,
+) -> typing.Generator[typing.TextIO, None, None]:
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, mode, encoding='utf-8') as file:
+            yield file
+    else:
+        yield source
+
+def _code(token:str) -> int:
+    ans = CODES_BY_TOKEN.get(token)
+    if ans is not None:
+        return ans
+    try:
+        move = Move.from_uci(token)
+    except (IndexError, KeyError):
+        raise ValueError(token) from None
+    if move is None:
+        raise ValueError(token)
+    ans = move.code()
+    CODES_BY_TOKEN[token] = ans
+    return ans
+
+def _token(code:int) -> str:
+    ans = TOKENS_BY_CODE.get(code)
+    if ans is None:
+        ans = str(Move.from_code(code))
+        TOKENS_BY_CODE[code] = ans
+    return ans
+
+@functools.lru_cache(maxsize=ROOTS)
+def _root(notation:str) -> Position:
+    return Position.from_notation(notation)
+
+def _record(
+    headers:typing.Dict[str, str],
+    codes:array,
+    result:typing.Optional[Outcome],
+) -> GameRecord:
+    notation = headers.get('Root')
+    if notation is None:
+        root = NATIVE_POSITION
+    else:
+        root = _root(notation)
+    return GameRecord(
+        root=root,
+        moves=codes,
+        result=result,
+        headers=headers,
+    )
+
+def read_games(
+    source:SOURCE, *,
+    light:bool=False,
+) -> typing.Generator[ITEM, None, None]:
+    if type(light) is not bool:
+        raise TypeError(light)
+    with _opened(source, 'r') as file:
+        headers = dict()
+        codes = array('H')
+        movetext = False
+        for line in file:
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith('['):
+                if movetext:
+                    raise ValueError(line)
+                match = HEADER.fullmatch(line)
+                if match is None:
+                    raise ValueError(line)
+                name, value = match.groups()
+                if '\\' in value:
+                    value = ESCAPE.sub(r'\1', value)
+                headers[name] = value
+                continue
+            tokens = line.split()
+            try:
+                codes.extend([CODES_BY_TOKEN[token] for token in tokens])
+            except KeyError:
+                pass
+            else:
+                movetext = True
+                continue
+            for token in tokens:
+                if token not in RESULTS_BY_TOKEN:
+                    codes.append(_code(token))
+                    movetext = True
+                    continue
+                record = _record(headers, codes, RESULTS_BY_TOKEN[token])
+                if light:
+                    yield record
+                else:
+                    yield record.game()
+                headers = dict()
+                codes = array('H')
+                movetext = False
+        if headers or movetext:
+            raise ValueError(headers)
+
+class GameWriter:
+
+    # methods
+    #   dunder
+    def __enter__(self) -> typing.Self:
+        return self
+    def __exit__(self, *args) -> None:
+        self.close()
+    def __init__(self, target:SOURCE, *, buffer:int=BUFFER) -> None:
+        if type(buffer) is not int:
+            raise TypeError(buffer)
+        if buffer < 1:
+            raise ValueError(buffer)
+        if isinstance(target, (str, os.PathLike)):
+            self._file = open(target, 'w', encoding='utf-8')
+            self._owned = True
+        else:
+            self._file = target
+            self._owned = False
+        self._buffer = buffer
+        self._parts = list()
+        self._size = 0
+        self._count = 0
+    def __len__(self) -> int:
+        return self._count
+
+    #   protected
+    def _append(self, text:str) -> None:
+        self._parts.append(text)
+        self._size += len(text)
+        if self._size >= self._buffer:
+            self.flush()
+
+    @classmethod
+    def _header(cls, name:str, value:str) -> str:
+        if not re.fullmatch(r'\w+', name):
+            raise ValueError(name)
+        value = value.replace('\\', '\\\\').replace('"', '\\"')
+        return f'[{name} "{value}"]\n'
+
+    #   public
+    def close(self) -> None:
+        self.flush()
+        if self._owned:
+            self._file.close()
+
+    def flush(self) -> None:
+        self._file.write(''.join(self._parts))
+        self._parts = list()
+        self._size = 0
+
+    def write(self, item:ITEM, **headers:str) -> None:
+        if type(item) is Game:
+            root = item.root()
+            codes = item.move_codes()
+            result = item.result()
+            headers = dict(item.headers(), **headers)
+        elif type(item) is GameRecord:
+            root = item.root
+            codes = item.moves
+            result = item.result
+            headers = dict(item.headers, **headers)
+        else:
+            raise TypeError(item)
+        headers.pop('Root', None)
+        headers['Result'] = TOKENS_BY_RESULT[result]
+        notation = root.to_notation()
+        if notation != NATIVE_NOTATION:
+            headers['Root'] = notation
+        lines = [self._header(k, str(v)) for k, v in headers.items()]
+        lines.append('\n')
+        line = ''
+        for token in [_token(code) for code in codes] + [headers['Result']]:
+            if line and len(line) + 1 + len(token) > WIDTH:
+                lines.append(line + '\n')
+                line = token
+            elif line:
+                line += ' ' + token
+            else:
+                line = token
+        lines.append(line + '\n\n')
+        self._append(''.join(lines))
+        self._count += 1
@@ -0,0 +1,508 @@
+import argparse
+import collections
+import os
+import sys
+import time
+import typing
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from glinski._consts import *
+from glinski._dataholders import *
+from glinski._dataholders.tablebases import (
+    _canonical,
+    _cells,
+    _from_notation,
+    _index,
+    _notation,
+    _size,
+    DRAW,
+    HEADER,
+    INVALID,
+    LOSS,
+    MAGIC,
+    PLY_BITS,
+    PLY_MASK,
+    STALEMATE_LOSS,
+    STALEMATE_WIN,
+    TURNS,
+    WIN,
+)
+from glinski._enums import *
+
+__all__ = ['generate_tablebase']
+
+CELLS = tuple(Cell)
+INDICES = {cell:i for i, cell in enumerate(CELLS)}
+SUFFIX = '.gtb'
+CHUNKS_PER_WORKER = 8
+NO_COUNT = 0xFFFF
+RAYS = typing.Tuple[typing.Tuple[typing.Tuple[int, ...], ...], ...]
+CAPTURE = typing.Tuple[int, int, int]
+SCAN = typing.Tuple[
+    bytes,
+    bytes,
+    typing.List[int],
+    typing.List[int],
+    typing.List[CAPTURE],
+]
+
+def _rays(*motions, leap:bool=False) -> RAYS:
+    ans = list()
+    for cell in CELLS:
+        rays = list()
+        for motion in motions:
+            for ray in motion.rays(cell):
+                if not ray:
+                    continue
+                if leap:
+                    ray = ray[:1]
+                rays.append(tuple(INDICES[c] for c in ray))
+        ans.append(tuple(rays))
+    return tuple(ans)
+
+def _lines(rays:RAYS) -> typing.Tuple[typing.Dict[int, typing.Tuple[int, ...]], ...]:
+    return tuple(
+        {ray[n]:ray[:n] for ray in cell_rays for n in range(len(ray))}
+        for cell_rays in rays
+    )
+
+RAYS_BY_KIND = {
+    PieceKind.KNIGHT:_rays(consts.motions.HORSE, leap=True),
+    PieceKind.BISHOP:_rays(consts.motions.DIAGONAL),
+    PieceKind.ROOK:_rays(consts.motions.FILE),
+    PieceKind.QUEEN:_rays(consts.motions.DIAGONAL, consts.motions.FILE),
+    PieceKind.KING:_rays(
+        consts.motions.DIAGONAL,
+        consts.motions.FILE,
+        leap=True,
+    ),
+}
+LINES_BY_KIND = {kind:_lines(rays) for kind, rays in RAYS_BY_KIND.items()}
+CONTEXTS = collections.OrderedDict()
+MAX_CONTEXTS = 4
+
+class _Context:
+
+    # methods
+    #   dunder
+    def __enter__(self) -> typing.Self:
+        return self
+    def __exit__(self, *args) -> None:
+        self.close()
+    def __init__(self, notation:str, directory:str) -> None:
+        self.material = _from_notation(notation)
+        self.rays = tuple(RAYS_BY_KIND[p.kind] for p in self.material)
+        self.lines = tuple(LINES_BY_KIND[p.kind] for p in self.material)
+        self.sides = tuple(TURNS[p.player] for p in self.material)
+        self.kings = tuple(
+            self.material.index(Piece.by_items(
+                kind=PieceKind.KING,
+                player=player,
+            ))
+            for player in (Player.WHITE, Player.BLACK)
+        )
+        self.subtables = dict()
+        for piece in set(self.material):
+            if piece.kind == PieceKind.KING:
+                continue
+            pieces = list(self.material)
+            pieces.remove(piece)
+            if len(pieces) == 2:
+                self.subtables[piece] = None
+                continue
+            path = _path(_canonical(pieces), directory)
+            try:
+                self.subtables[piece] = Tablebase(path)
+            except BaseException:
+                self.close()
+                raise
+
+    #   protected
+    def _attacked(self,
+        cell:int,
+        side:int,
+        cells:typing.Sequence[int],
+        occupied:typing.Set[int],
+        skip:int=-1,
+    ) -> bool:
+        for j in range(len(cells)):
+            if self.sides[j] != side or j == skip:
+                continue
+            between = self.lines[j][cells[j]].get(cell)
+            if between is None:
+                continue
+            for c in between:
+                if c in occupied:
+                    break
+            else:
+                return True
+        return False
+
+    def _capture(self, cells:typing.List[int], victim:int, turn:int) -> int:
+        piece = self.material[victim]
+        table = self.subtables[piece]
+        if table is None:
+            return DRAW << PLY_BITS
+        pieces = self.material[:victim] + self.material[victim + 1:]
+        offset = table._offset(
+            pieces,
+            cells[:victim] + cells[victim + 1:],
+            turn,
+        )
+        return table._data[offset] | table._data[offset + 1] << 8
+
+    #   public
+    def close(self) -> None:
+        for table in self.subtables.values():
+            if table is not None:
+                table.close()
+
+    def is_valid(self, cells:typing.List[int], turn:int) -> bool:
+        occupied = set(cells)
+        if len(occupied) != len(cells):
+            return False
+        king = cells[self.kings[1 - turn]]
+        return not self._attacked(king, turn, cells, occupied)
+
+    def predecessors(self, index:int) -> typing.Set[int]:
+        turn = index // (_size(self.material) // 2)
+        cells = _cells(index, len(self.material))
+        occupied = set(cells)
+        mover = 1 - turn
+        king = self.kings[turn]
+        ans = set()
+        for j in range(len(cells)):
+            if self.sides[j] != mover:
+                continue
+            origin = cells[j]
+            occupied.discard(origin)
+            for ray in self.rays[j][origin]:
+                for c in ray:
+                    if c in occupied:
+                        break
+                    cells[j] = c
+                    occupied.add(c)
+                    if not self._attacked(cells[king], mover, cells, occupied):
+                        ans.add(_index(cells, mover))
+                    occupied.discard(c)
+            cells[j] = origin
+            occupied.add(origin)
+        return ans
+
+    def successors(self,
+        cells:typing.List[int],
+        turn:int,
+    ) -> typing.Tuple[typing.Set[int], typing.List[int]]:
+        occupied = set(cells)
+        owners = {c:j for j, c in enumerate(cells)}
+        king = self.kings[turn]
+        enemy = 1 - turn
+        moves = set()
+        captures = list()
+        for j in range(len(cells)):
+            if self.sides[j] != turn:
+                continue
+            origin = cells[j]
+            occupied.discard(origin)
+            for ray in self.rays[j][origin]:
+                for c in ray:
+                    victim = owners.get(c, -1)
+                    if victim >= 0 and self.sides[victim] == turn:
+                        break
+                    cells[j] = c
+                    if victim < 0:
+                        occupied.add(c)
+                        if not self._attacked(
+                            cells[king], enemy, cells, occupied,
+                        ):
+                            moves.add(_index(cells, enemy))
+                        occupied.discard(c)
+                        continue
+                    if victim != self.kings[enemy]:
+                        if not self._attacked(
+                            cells[king], enemy, cells, occupied, victim,
+                        ):
+                            captures.append(
+                                self._capture(cells, victim, enemy)
+                            )
+                    break
+            cells[j] = origin
+            occupied.add(origin)
+        return moves, captures
+
+def _context(notation:str, directory:str) -> _Context:
+    key = notation, directory
+    ans = CONTEXTS.get(key)
+    if ans is not None:
+        CONTEXTS.move_to_end(key)
+        return ans
+    ans = _Context(notation, directory)
+    CONTEXTS[key] = ans
+    while len(CONTEXTS) > MAX_CONTEXTS:
+        CONTEXTS.popitem(last=False)[1].close()
+    return ans
+
+def _release(notation:str, directory:str) -> None:
+    context = CONTEXTS.pop((notation, directory), None)
+    if context is not None:
+        context.close()
+
+def _path(material:typing.Tuple[Piece, ...], directory:str) -> str:
+    return os.path.join(directory, _notation(material) + SUFFIX)
+
+def _scan(notation:str, directory:str, start:int, stop:int) -> SCAN:
+    context = _context(notation, directory)
+    count = len(context.material)
+    half = _size(context.material) // 2
+    codes = bytearray(stop - start)
+    counts = array('H', [NO_COUNT]) * (stop - start)
+    mates = list()
+    stalemates = list()
+    captures = list()
+    for index in range(start, stop):
+        turn = index // half
+        cells = _cells(index, count)
+        if _index(cells, turn) != index:
+            continue
+        if not context.is_valid(cells, turn):
+            continue
+        moves, values = context.successors(cells, turn)
+        codes[index - start] = DRAW
+        counts[index - start] = len(moves) + len(values)
+        for value in values:
+            captures.append((index, value >> PLY_BITS, value & PLY_MASK))
+        if moves or values:
+            continue
+        king = cells[context.kings[turn]]
+        if context._attacked(king, 1 - turn, cells, set(cells)):
+            mates.append(index)
+        else:
+            stalemates.append(index)
+    return bytes(codes), counts.tobytes(), mates, stalemates, captures
+
+def _expand(
+    notation:str,
+    directory:str,
+    indices:typing.List[int],
+) -> typing.List[typing.Set[int]]:
+    context = _context(notation, directory)
+    return [context.predecessors(index) for index in indices]
+
+def _chunks(items:typing.Sequence, count:int) -> typing.List[typing.Sequence]:
+    step = max(1, -(-len(items) // count))
+    return [items[i:i + step] for i in range(0, len(items), step)]
+
+class _Builder:
+
+    # methods
+    #   dunder
+    def __init__(self,
+        material:typing.Tuple[Piece, ...],
+        directory:str,
+        executor:typing.Optional[ProcessPoolExecutor],
+        workers:int,
+    ) -> None:
+        self.notation = _notation(material)
+        self.directory = directory
+        self.executor = executor
+        self.workers = workers
+        self.size = _size(material)
+        self.codes = bytearray(self.size)
+        self.plies = array('H', [0]) * self.size
+        self.counts = array('H', [NO_COUNT]) * self.size
+        self.mates = list()
+        self.stalemates = list()
+        self.captures = list()
+
+    #   protected
+    def _map(self, function, *args) -> typing.Iterator:
+        if self.executor is None:
+            return map(function, *args)
+        return self.executor.map(function, *args)
+
+    def _predecessors(
+        self,
+        indices:typing.List[int],
+    ) -> typing.Iterator[typing.Tuple[int, typing.Set[int]]]:
+        parts = _chunks(indices, self.workers * CHUNKS_PER_WORKER)
+        results = self._map(
+            _expand,
+            [self.notation] * len(parts),
+            [self.directory] * len(parts),
+            parts,
+        )
+        for part, predecessors in zip(parts, results):
+            yield from zip(part, predecessors)
+
+    def _retrograde(self,
+        losses:typing.List[int],
+        win:int,
+        loss:int,
+    ) -> None:
+        codes = self.codes
+        plies = self.plies
+        counts = self.counts
+        wins = collections.defaultdict(list)
+        refutations = collections.defaultdict(list)
+        for index, code, ply in self.captures:
+            if code == loss:
+                wins[ply + 1].append(index)
+            elif code == win:
+                refutations[ply + 1].append(index)
+        ply = 0
+        while losses or wins or refutations:
+            if ply > PLY_MASK:
+                raise ValueError(ply)
+            decided = list()
+            for index in losses:
+                codes[index] = loss
+                decided.append(index)
+            for index in wins.pop(ply, ()):
+                if codes[index] == DRAW:
+                    codes[index] = win
+                    plies[index] = ply
+                    decided.append(index)
+            for index in refutations.pop(ply, ()):
+                if codes[index] != DRAW:
+                    continue
+                counts[index] -= 1
+                if not counts[index]:
+                    codes[index] = loss
+                    plies[index] = ply
+                    decided.append(index)
+            losses = list()
+            for index, predecessors in self._predecessors(decided):
+                if codes[index] == loss:
+                    events = wins[ply + 1]
+                else:
+                    events = refutations[ply + 1]
+                for predecessor in predecessors:
+                    if codes[predecessor] == DRAW:
+                        events.append(predecessor)
+            ply += 1
+
+    def _scan(self) -> None:
+        parts = _chunks(range(self.size), self.workers * CHUNKS_PER_WORKER)
+        results = self._map(
+            _scan,
+            [self.notation] * len(parts),
+            [self.directory] * len(parts),
+            [part.start for part in parts],
+            [part.stop for part in parts],
+        )
+        for part, (codes, counts, mates, stalemates, captures) in zip(
+            parts, results,
+        ):
+            self.codes[part.start:part.stop] = codes
+            self.counts[part.start:part.stop] = array('H', counts)
+            self.mates += mates
+            self.stalemates += stalemates
+            self.captures += captures
+
+    def _write(self, path:str) -> None:
+        entries = array('H', [0]) * self.size
+        for index in range(self.size):
+            code = self.codes[index]
+            if code != INVALID:
+                entries[index] = code << PLY_BITS | self.plies[index]
+        if sys.byteorder != 'little':
+            entries.byteswap()
+        temporary = path + '.tmp'
+        with open(temporary, 'wb') as file:
+            file.write(HEADER.pack(MAGIC, self.notation.encode()))
+            file.write(entries.tobytes())
+        os.replace(temporary, path)
+
+    #   public
+    def build(self, path:str) -> None:
+        self._scan()
+        self._retrograde(self.mates, WIN, LOSS)
+        self._retrograde(self.stalemates, STALEMATE_WIN, STALEMATE_LOSS)
+        self._write(path)
+
+def _generate(
+    material:typing.Tuple[Piece, ...],
+    directory:str,
+    executor:typing.Optional[ProcessPoolExecutor],
+    workers:int,
+    force:bool,
+) -> str:
+    path = _path(material, directory)
+    if os.path.exists(path) and not force:
+        return path
+    for piece in set(material):
+        if piece.kind == PieceKind.KING:
+            continue
+        pieces = list(material)
+        pieces.remove(piece)
+        if len(pieces) > 2:
+            _generate(_canonical(pieces), directory, executor, workers, False)
+    builder = _Builder(material, directory, executor, workers)
+    try:
+        builder.build(path)
+    finally:
+        _release(builder.notation, directory)
+    return path
+
+def generate_tablebase(
+    material:str,
+    directory:typing.Union[str, os.PathLike]='.', *,
+    workers:typing.Optional[int]=1,
+    force:bool=False,
+) -> str:
+    material = _from_notation(material)
+    directory = os.fspath(directory)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if type(workers) is not int:
+        raise TypeError(workers)
+    if workers < 1:
+        raise ValueError(workers)
+    if type(force) is not bool:
+        raise TypeError(force)
+    os.makedirs(directory, exist_ok=True)
+    if workers == 1:
+        return _generate(material, directory, None, 1, force)
+    with ProcessPoolExecutor(workers) as executor:
+        return _generate(material, directory, executor, workers, force)
+
+def main(args:typing.Optional[typing.List[str]]=None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m glinski.tablebase",
+        description="Generate a pawnless endgame tablebase.",
+    )
+    parser.add_argument(
+        'material',
+        help="piece symbols, for example KQk",
+    )
+    parser.add_argument(
+        '--directory',
+        default='.',
+        help="directory of the table files",
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help="number of worker processes",
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help="regenerate the table even if its file exists",
+    )
+    ns = parser.parse_args(args)
+    start = time.perf_counter()
+    path = generate_tablebase(
+        ns.material,
+        ns.directory,
+        workers=ns.workers,
+        force=ns.force,
+    )
+    seconds = time.perf_counter() - start
+    with Tablebase(path) as table:
+        print(f"material: {table.material()}")
+        print(f"entries: {len(table)}")
+    print(f"path: {path}")
+    print(f"seconds: {seconds:.3f}")
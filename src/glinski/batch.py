@@ -0,0 +1 @@
+from glinski._batch import *
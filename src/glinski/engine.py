@@ -0,0 +1,5 @@
+from glinski._engine import *
+from glinski._engine import main
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,5 @@
+from glinski._perft import *
+from glinski._perft import main
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,5 @@
+from glinski._tablebase import *
+from glinski._tablebase import main
+
+if __name__ == '__main__':
+    main()
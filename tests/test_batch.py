@@ -0,0 +1,48 @@
+import importlib.util
+import random
+import unittest
+
+from glinski import *
+
+if importlib.util.find_spec('numpy') is not None:
+    from glinski.batch import *
+
+
+def _positions():
+    ans = [Position.native()]
+    rng = random.Random(1)
+    position = ans[0]
+    for _ in range(60):
+        moves = sorted(position.legal_moves(), key=str)
+        if not moves:
+            break
+        position = position.apply(rng.choice(moves))
+        ans.append(position)
+    for pieces in ('Kf1 rf6 kf11', 'Kf1 bf3 nb1 kb7 Rb4', 'Kf1 nd2 Nk1 kh6'):
+        dictionary = dict()
+        for token in pieces.split():
+            dictionary[Cell[token[1:]]] = Piece.from_symbol(token[0])
+        ans.append(Position(arrangement=Arrangement(dictionary)))
+    return ans
+
+
+@unittest.skipIf(importlib.util.find_spec('numpy') is None, 'needs numpy')
+class TestBatch(unittest.TestCase):
+    def test_round_trip(self):
+        arrangements = [p.arrangement for p in _positions()]
+        self.assertEqual(decode(encode(arrangements)), arrangements)
+
+    def test_is_check_matches_positions(self):
+        positions = _positions()
+        for turn in Player:
+            boards = encode([p.arrangement for p in positions])
+            expected = [
+                Position(arrangement=p.arrangement, turn=turn).is_check()
+                for p in positions
+            ]
+            self.assertEqual(is_check(boards, turn).tolist(), expected)
+
+    def test_native_mobility(self):
+        boards = encode([Position.native().arrangement])
+        self.assertEqual(mobility(boards, Player.WHITE).tolist(), [51])
+        self.assertEqual(mobility(boards, Player.BLACK).tolist(), [51])
@@ -0,0 +1,51 @@
+import os
+import stat
+import tempfile
+import unittest
+
+from glinski import *
+
+
+def _game(moves, result):
+    ans = Game(Position.native())
+    for move in moves.split():
+        ans.append(Move.from_uci(move))
+    ans.adjudicate(result)
+    return ans
+
+
+class TestOpeningBook(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'book.glob')
+
+    def test_lookup(self):
+        games = [
+            _game('d1c3 d9c6', Outcome.FULL_WIN_FOR_WHITE),
+            _game('d1c3 d9c6', Outcome.DRAW),
+            _game('e4e5 d9c6', Outcome.FULL_WIN_FOR_BLACK),
+        ]
+        self.assertEqual(build_opening_book(games, self.path), 4)
+        with OpeningBook(self.path) as book:
+            self.assertEqual(len(book), 4)
+            root = Position.native()
+            entries = {str(e.move):e for e in book.entries(root)}
+            self.assertEqual(set(entries), {'d1c3', 'e4e5'})
+            self.assertEqual(entries['d1c3'].weight, 2)
+            self.assertEqual(entries['d1c3'].wins, 1)
+            self.assertEqual(entries['d1c3'].draws, 1)
+            self.assertEqual(entries['e4e5'].losses, 1)
+            reply = root.apply(Move.from_uci('d1c3'))
+            entry, = book.entries(reply)
+            self.assertEqual(str(entry.move), 'd9c6')
+            self.assertEqual(entry.losses, 1)
+            self.assertNotIn(reply.apply(Move.from_uci('d9c6')), book)
+
+    def test_mode_follows_umask(self):
+        build_opening_book([], self.path)
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = stat.S_IMODE(os.stat(self.path).st_mode)
+        self.assertEqual(mode, 0o666 & ~umask)
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ['book.glob'])
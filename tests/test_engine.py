@@ -0,0 +1,22 @@
+import unittest
+
+from glinski import *
+
+
+class TestEngine(unittest.TestCase):
+    def test_default_table_is_deterministic(self):
+        position = Position.native()
+        first = search(position, depth=3)
+        search(position, depth=4)
+        second = search(position, depth=3)
+        self.assertEqual(first.score, second.score)
+        self.assertEqual(first.pv, second.pv)
+        self.assertEqual(first.nodes, second.nodes)
+
+    def test_shared_table_keeps_the_full_pv(self):
+        position = Position.native()
+        table = TranspositionTable()
+        first = search(position, depth=3, table=table)
+        second = search(position, depth=3, table=table)
+        self.assertEqual(first.score, second.score)
+        self.assertEqual(first.pv, second.pv)
@@ -0,0 +1,19 @@
+import unittest
+
+from glinski import *
+from glinski._perft import _reference
+
+
+class TestPerft(unittest.TestCase):
+    def test_reference_counts(self):
+        for name, info in REFERENCES.items():
+            position = _reference(name)
+            for depth, count in enumerate(info['counts'][:3]):
+                with self.subTest(name=name, depth=depth):
+                    self.assertEqual(perft(position, depth), count)
+
+    def test_divide_sums_to_perft(self):
+        position = _reference('pins')
+        divided = perft_divide(position, 2)
+        self.assertEqual(len(divided), REFERENCES['pins']['counts'][1])
+        self.assertEqual(sum(divided.values()), perft(position, 2))
@@ -0,0 +1,39 @@
+import random
+import unittest
+
+from glinski import *
+from glinski._perft import REFERENCES, _reference
+
+
+def _positions():
+    ans = [_reference(name) for name in REFERENCES]
+    rng = random.Random(0)
+    position = Position.native()
+    for _ in range(40):
+        moves = sorted(position.legal_moves(), key=str)
+        if not moves:
+            break
+        position = position.apply(rng.choice(moves))
+        ans.append(position)
+    return ans
+
+
+class TestBytes(unittest.TestCase):
+    def test_round_trip(self):
+        for position in _positions():
+            data = position.to_bytes()
+            self.assertEqual(Position.from_bytes(data), position)
+            self.assertEqual(Position.from_bytes(memoryview(data)), position)
+
+    def test_unpack(self):
+        positions = _positions()
+        data = b''.join(p.to_bytes() for p in positions)
+        self.assertEqual(Position.unpack(data), positions)
+        with self.assertRaises(ValueError):
+            Position.unpack(data[:-1])
+
+    def test_invalid_header(self):
+        data = bytearray(Position.native().to_bytes())
+        data[0] = 0xFF
+        with self.assertRaises(ValueError):
+            Position.from_bytes(data)
@@ -0,0 +1,32 @@
+import io
+import unittest
+
+from glinski import *
+
+
+class TestRecords(unittest.TestCase):
+    def test_decisive_result_round_trip(self):
+        text = '[Event "x"]\n[Result "1-0"]\n\nd1c3 d9c6 1-0\n\n'
+        game, = read_games(io.StringIO(text))
+        self.assertIsNone(game.termination())
+        self.assertEqual(game.result(), Outcome.FULL_WIN_FOR_WHITE)
+        self.assertEqual(game.headers(), {'Event':'x'})
+        with self.assertRaises(GameAlreadyOverError):
+            game.append(Move.from_uci('c3d5'))
+        target = io.StringIO()
+        with GameWriter(target) as writer:
+            writer.write(game)
+        self.assertEqual(target.getvalue(), text)
+
+    def test_light_round_trip(self):
+        text = '[Event "x"]\n[Result "0-1"]\n\nd1c3 d9c6 0-1\n\n'
+        record, = read_games(io.StringIO(text), light=True)
+        self.assertEqual(record.result, Outcome.FULL_WIN_FOR_BLACK)
+        target = io.StringIO()
+        with GameWriter(target) as writer:
+            writer.write(record)
+        self.assertEqual(target.getvalue(), text)
+
+
+if __name__ == '__main__':
+    unittest.main()
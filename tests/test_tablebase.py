@@ -0,0 +1,59 @@
+import tempfile
+import unittest
+
+from glinski import *
+
+
+def _position(pieces, turn):
+    dictionary = dict()
+    for token in pieces.split():
+        dictionary[Cell[token[1:]]] = Piece.from_symbol(token[0])
+    return Position(arrangement=Arrangement(dictionary), turn=turn)
+
+
+class TestTablebase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.path = generate_tablebase('KNk', cls.directory.name)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def test_probe(self):
+        with Tablebase(self.path) as table:
+            self.assertEqual(table.material(), 'KNk')
+            position = _position('Kf1 Nc1 kf11', Player.WHITE)
+            self.assertEqual(table.outcome(position), Outcome.DRAW)
+            self.assertEqual(table.distance(position), 0)
+            inverted = Position(
+                arrangement=Arrangement({
+                    cell.vflip():piece.invert()
+                    for cell, piece in position.arrangement.items()
+                    if piece is not None
+                }),
+                turn=Player.BLACK,
+            )
+            self.assertEqual(table.outcome(inverted), Outcome.DRAW)
+            with self.assertRaises(ValueError):
+                table.outcome(_position('Kf1 Qc1 kf11', Player.WHITE))
+
+    def test_invalid_positions(self):
+        with Tablebase(self.path) as table:
+            for turn in Player:
+                adjacent = _position('Kf5 Nc1 kf6', turn)
+                self.assertIsNone(table.outcome(adjacent))
+
+    def test_mirrored_positions_agree(self):
+        with Tablebase(self.path) as table:
+            for pieces in ('Kf1 Nc1 kf11', 'Kb1 Ne4 kk7', 'Kf6 Nf8 ka6'):
+                mirrored = ' '.join(
+                    token[0] + Cell[token[1:]].hflip().name
+                    for token in pieces.split()
+                )
+                for turn in Player:
+                    self.assertEqual(
+                        table.outcome(_position(pieces, turn)),
+                        table.outcome(_position(mirrored, turn)),
+                    )